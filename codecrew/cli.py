@@ -124,6 +124,9 @@ async def start_interactive(
     from codecrew.tools.permissions import PermissionRequest
     from codecrew.models.types import ToolCall as ToolCallType
 
+    # Share one connection across the session instead of reconnecting per query
+    await db.open()
+
     try:
         # Create model clients
         clients = get_available_clients(settings)
@@ -228,6 +231,8 @@ async def start_interactive(
             import traceback
             console.print(traceback.format_exc())
         raise typer.Exit(1)
+    finally:
+        await db.close()
 
 
 @app.command()
@@ -18,21 +18,30 @@ CONFIG_FILE = CONFIG_DIR / "config.yaml"
 DEFAULTS_FILE = Path(__file__).parent / "defaults.yaml"
 
 
+# Matches ${VAR_NAME} references in config values
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+
 def _expand_env_vars(value: Any) -> Any:
     """Recursively expand ${ENV_VAR} syntax in strings."""
-    if isinstance(value, str):
-        # Match ${VAR_NAME} pattern
-        pattern = r"\$\{([^}]+)\}"
-        matches = re.findall(pattern, value)
-        for var_name in matches:
-            env_value = os.environ.get(var_name, "")
-            value = value.replace(f"${{{var_name}}}", env_value)
-        return value if value else None
-    elif isinstance(value, dict):
-        return {k: _expand_env_vars(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        return [_expand_env_vars(item) for item in value]
-    return value
+    env_get = os.environ.get
+    substitute = _ENV_VAR_PATTERN.sub
+
+    def replace(match: re.Match[str]) -> str:
+        return env_get(match.group(1), "")
+
+    def expand(value: Any) -> Any:
+        if isinstance(value, str):
+            if "${" in value:
+                value = substitute(replace, value)
+            return value if value else None
+        elif isinstance(value, dict):
+            return {k: expand(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [expand(item) for item in value]
+        return value
+
+    return expand(value)
 
 
 def _deep_merge(base: dict, override: dict) -> dict:
@@ -37,6 +37,9 @@ class ConversationConfig(BaseModel):
 
     first_responder: Literal["rotate", "claude", "gpt", "gemini", "grok"] = "rotate"
     silence_threshold: float = Field(default=0.3, ge=0.0, le=1.0)
+    # Decide who speaks with one call to a router model instead of one per model
+    batch_should_speak: bool = False
+    router_model: Optional[Literal["claude", "gpt", "gemini", "grok"]] = None
     max_context_tokens: int = Field(default=100000, ge=1000)
     auto_save: bool = True
     save_interval_minutes: int = Field(default=5, ge=1)
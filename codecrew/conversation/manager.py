@@ -16,7 +16,7 @@ It provides:
 import json
 import logging
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any, Callable, Optional, Set
 
 from codecrew.models.base import ModelClient
@@ -59,8 +59,8 @@ class ConversationManager:
         # Message ID mapping (orchestrator messages don't have IDs)
         self._message_id_map: dict[int, str] = {}  # id(message) -> db_id
 
-        # Callbacks for events
-        self._on_message_persisted: Optional[Callable[[str], None]] = None
+        # Callbacks for events (rebuilt on registration, iterated as-is on dispatch)
+        self._on_message_persisted: tuple[Callable[[str], None], ...] = ()
 
     @property
     def current_session_id(self) -> Optional[str]:
@@ -108,7 +108,7 @@ class ConversationManager:
         self._pinned_ids.clear()
         self._message_id_map.clear()
 
-        logger.info(f"Created session: {session_id}")
+        logger.info("Created session: %s", session_id)
 
         return Session.from_db_row(row)
 
@@ -129,12 +129,11 @@ class ConversationManager:
             raise ValueError(f"Session not found: {session_id}")
 
         # Load messages
-        message_rows = await self.db.get_session_messages(session_id)
-        messages = []
-
-        for msg_row in message_rows:
-            tool_calls = await self.db.get_message_tool_calls(msg_row["id"])
-            messages.append(PersistentMessage.from_db_row(msg_row, tool_calls))
+        message_rows = await self.db.get_session_messages_with_tool_calls(session_id)
+        messages = [
+            PersistentMessage.from_db_row(msg_row, msg_row["tool_calls"])
+            for msg_row in message_rows
+        ]
 
         # Load pinned messages
         pinned_rows = await self.db.get_pinned_messages(session_id)
@@ -143,7 +142,7 @@ class ConversationManager:
         self._current_session_id = session_id
         self._message_id_map.clear()
 
-        logger.info(f"Loaded session: {session_id} ({len(messages)} messages)")
+        logger.info("Loaded session: %s (%d messages)", session_id, len(messages))
 
         return Session.from_db_row(row, messages)
 
@@ -323,29 +322,76 @@ class ConversationManager:
         # Store mapping
         self._message_id_map[id(message)] = message_id
 
-        logger.debug(f"Persisted message: {message_id}")
+        logger.debug("Persisted message: %s", message_id)
 
-        if self._on_message_persisted:
-            self._on_message_persisted(message_id)
+        for callback in self._on_message_persisted:
+            callback(message_id)
 
         return message_id
 
     async def persist_messages(
         self,
         messages: list[OrchestratorMessage],
+        usages: Optional[list[Optional[Usage]]] = None,
     ) -> list[str]:
         """Persist multiple messages in a batch.
 
+        The messages, then their tool calls, are each written with one
+        executemany and a single commit instead of one commit per row.
+
         Args:
-            messages: Messages to persist
+            messages: Messages to persist, in conversation order
+            usages: Optional usage information for each message
 
         Returns:
             List of database message IDs
         """
-        message_ids = []
-        for msg in messages:
-            msg_id = await self.persist_message(msg)
-            message_ids.append(msg_id)
+        if not self._current_session_id:
+            raise ValueError("No active session")
+        if not messages:
+            return []
+
+        # Distinct timestamps keep the batch in order when sorted by created_at
+        now = datetime.now(UTC)
+        message_rows: list[dict] = []
+        tool_call_rows: list[dict] = []
+        for i, message in enumerate(messages):
+            message_id = str(uuid.uuid4())
+            usage = usages[i] if usages else None
+            message_rows.append(
+                {
+                    "id": message_id,
+                    "session_id": self._current_session_id,
+                    "role": message.role.value,
+                    "content": message.content,
+                    "model": message.model,
+                    "tokens_used": usage.total_tokens if usage else None,
+                    "cost_estimate": usage.cost_estimate if usage else None,
+                    "created_at": (now + timedelta(microseconds=i)).isoformat(),
+                }
+            )
+            tool_call_rows.extend(
+                {
+                    "id": tc.id,
+                    "message_id": message_id,
+                    "tool_name": tc.name,
+                    "parameters": tc.arguments,
+                    "status": "pending",
+                }
+                for tc in message.tool_calls
+            )
+
+        # One transaction, so messages are never stored without their tool calls
+        message_ids = await self.db.batch_add_messages(message_rows, tool_calls=tool_call_rows)
+
+        for message, message_id in zip(messages, message_ids):
+            self._message_id_map[id(message)] = message_id
+        logger.debug("Persisted %d messages", len(message_ids))
+
+        for message_id in message_ids:
+            for callback in self._on_message_persisted:
+                callback(message_id)
+
         return message_ids
 
     async def get_message(self, message_id: str) -> Optional[PersistentMessage]:
@@ -379,14 +425,10 @@ class ConversationManager:
         if not self._current_session_id:
             return []
 
-        rows = await self.db.get_session_messages(self._current_session_id, limit=limit)
-        messages = []
-
-        for row in rows:
-            tool_calls = await self.db.get_message_tool_calls(row["id"])
-            messages.append(PersistentMessage.from_db_row(row, tool_calls))
-
-        return messages
+        rows = await self.db.get_session_messages_with_tool_calls(
+            self._current_session_id, limit=limit
+        )
+        return [PersistentMessage.from_db_row(row, row["tool_calls"]) for row in rows]
 
     async def load_as_orchestrator_messages(
         self,
@@ -468,7 +510,7 @@ class ConversationManager:
         await self.db.pin_message(self._current_session_id, message_id, pin_id)
         self._pinned_ids.add(message_id)
 
-        logger.debug(f"Pinned message: {message_id}")
+        logger.debug("Pinned message: %s", message_id)
         return True
 
     async def unpin_message(self, message_id: str) -> bool:
@@ -483,7 +525,7 @@ class ConversationManager:
         await self.db.unpin_message(message_id)
         self._pinned_ids.discard(message_id)
 
-        logger.debug(f"Unpinned message: {message_id}")
+        logger.debug("Unpinned message: %s", message_id)
         return True
 
     async def get_pinned_messages(self) -> list[PersistentMessage]:
@@ -629,11 +671,8 @@ class ConversationManager:
         if not session_row:
             raise ValueError(f"Session not found: {target_id}")
 
-        message_rows = await self.db.get_session_messages(target_id)
-        messages = []
-        for row in message_rows:
-            tool_calls = await self.db.get_message_tool_calls(row["id"])
-            messages.append(PersistentMessage.from_db_row(row, tool_calls))
+        message_rows = await self.db.get_session_messages_with_tool_calls(target_id)
+        messages = [PersistentMessage.from_db_row(row, row["tool_calls"]) for row in message_rows]
 
         session = Session.from_db_row(session_row, messages)
 
@@ -737,34 +776,42 @@ class ConversationManager:
             metadata=parsed.get("metadata"),
         )
 
-        # Import messages
+        # Collect messages, tool calls and pins, keeping the original
+        # timestamps to preserve ordering
+        messages: list[dict[str, Any]] = []
+        tool_calls: list[dict[str, Any]] = []
+
         for msg_data in parsed.get("messages", []):
             message_id = str(uuid.uuid4())
-
-            await self.db.add_message(
-                message_id=message_id,
-                session_id=session.id,
-                role=msg_data["role"],
-                content=msg_data["content"],
-                model=msg_data.get("model"),
-                tokens_used=msg_data.get("tokens_used"),
-                cost_estimate=msg_data.get("cost_estimate"),
+            messages.append(
+                {
+                    "id": message_id,
+                    "session_id": session.id,
+                    "role": msg_data["role"],
+                    "content": msg_data["content"],
+                    "model": msg_data.get("model"),
+                    "tokens_used": msg_data.get("tokens_used"),
+                    "cost_estimate": msg_data.get("cost_estimate"),
+                    "created_at": msg_data.get("created_at"),
+                    "is_pinned": bool(msg_data.get("is_pinned")),
+                }
             )
 
-            # Import tool calls
             for tc_data in msg_data.get("tool_calls", []):
-                await self.db.add_tool_call(
-                    tool_call_id=str(uuid.uuid4()),
-                    message_id=message_id,
-                    tool_name=tc_data["tool_name"],
-                    parameters=tc_data.get("parameters"),
-                    result=tc_data.get("result"),
-                    status=tc_data.get("status", "pending"),
+                tool_calls.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "message_id": message_id,
+                        "tool_name": tc_data["tool_name"],
+                        "parameters": tc_data.get("parameters"),
+                        "result": tc_data.get("result"),
+                        "status": tc_data.get("status", "pending"),
+                    }
                 )
 
-            # Handle pinned messages
-            if msg_data.get("is_pinned"):
-                await self.pin_message(message_id)
+        # Messages, their tool calls and pins are written in one transaction,
+        # so a failed import never leaves a partial session behind
+        await self.db.batch_add_messages(messages, tool_calls=tool_calls)
 
         return await self.load_session(session.id)
 
@@ -773,10 +820,12 @@ class ConversationManager:
     def on_message_persisted(self, callback: Callable[[str], None]) -> None:
         """Register a callback for when messages are persisted.
 
+        Callbacks are called in registration order.
+
         Args:
             callback: Function to call with message ID
         """
-        self._on_message_persisted = callback
+        self._on_message_persisted = self._on_message_persisted + (callback,)
 
 
 async def create_conversation_manager(
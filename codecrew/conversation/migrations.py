@@ -232,3 +232,81 @@ async def migration_003_add_history_and_settings(conn: aiosqlite.Connection) ->
         )
         """
     )
+
+
+@migration(4)
+async def migration_004_add_full_text_search(conn: aiosqlite.Connection) -> None:
+    """Add FTS5 indexes over session names and message content."""
+
+    # External-content FTS tables keep only the index; the text stays in the
+    # base tables and is mirrored in by the triggers below.
+    await conn.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS sessions_fts USING fts5(
+            name, content='sessions', content_rowid='rowid'
+        )
+        """
+    )
+    await conn.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+            content, content='messages', content_rowid='rowid'
+        )
+        """
+    )
+
+    # Keep sessions_fts in sync with sessions
+    await conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS sessions_fts_insert AFTER INSERT ON sessions BEGIN
+            INSERT INTO sessions_fts(rowid, name) VALUES (new.rowid, new.name);
+        END
+        """
+    )
+    await conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS sessions_fts_delete AFTER DELETE ON sessions BEGIN
+            INSERT INTO sessions_fts(sessions_fts, rowid, name)
+            VALUES ('delete', old.rowid, old.name);
+        END
+        """
+    )
+    await conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS sessions_fts_update AFTER UPDATE OF name ON sessions BEGIN
+            INSERT INTO sessions_fts(sessions_fts, rowid, name)
+            VALUES ('delete', old.rowid, old.name);
+            INSERT INTO sessions_fts(rowid, name) VALUES (new.rowid, new.name);
+        END
+        """
+    )
+
+    # Keep messages_fts in sync with messages
+    await conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+            INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, new.content);
+        END
+        """
+    )
+    await conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+            INSERT INTO messages_fts(messages_fts, rowid, content)
+            VALUES ('delete', old.rowid, old.content);
+        END
+        """
+    )
+    await conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF content ON messages BEGIN
+            INSERT INTO messages_fts(messages_fts, rowid, content)
+            VALUES ('delete', old.rowid, old.content);
+            INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, new.content);
+        END
+        """
+    )
+
+    # Index any rows that existed before this migration
+    await conn.execute("INSERT INTO sessions_fts(sessions_fts) VALUES ('rebuild')")
+    await conn.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
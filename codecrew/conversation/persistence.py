@@ -1,6 +1,8 @@
 """Database manager for conversation persistence using SQLite."""
 
+import asyncio
 import json
+import uuid
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
@@ -11,6 +13,24 @@ import aiosqlite
 from .migrations import MIGRATIONS, get_current_version, run_migrations
 
 
+def _build_fts_query(query: str) -> Optional[str]:
+    """Build an FTS5 MATCH expression from free-form user input.
+
+    Each whitespace-separated word is quoted (so FTS5 operators and
+    punctuation are treated literally) and turned into a prefix match.
+
+    Args:
+        query: Raw search text
+
+    Returns:
+        MATCH expression, or None if the query has no words
+    """
+    terms = query.split()
+    if not terms:
+        return None
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
 class DatabaseManager:
     """Async SQLite database manager for conversation persistence."""
 
@@ -18,10 +38,25 @@ class DatabaseManager:
         """Initialize the database manager.
 
         Args:
-            db_path: Path to the SQLite database file
+            db_path: Path to the SQLite database file, or ":memory:" for an
+                in-memory database (only useful with ``open()``, since each
+                new connection would otherwise see an empty database)
         """
         self.db_path = Path(db_path).expanduser()
         self._connection: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "DatabaseManager":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """Check if a persistent connection is open."""
+        return self._connection is not None
 
     async def initialize(self) -> None:
         """Initialize the database, creating it and running migrations if needed."""
@@ -32,13 +67,56 @@ class DatabaseManager:
         async with self.connect() as conn:
             await run_migrations(conn)
 
-    @asynccontextmanager
-    async def connect(self) -> AsyncGenerator[aiosqlite.Connection, None]:
-        """Get a database connection as an async context manager."""
+    async def open(self) -> None:
+        """Open a persistent connection shared by all subsequent operations.
+
+        Until ``close()`` is called, ``connect()`` hands out this connection
+        (one operation at a time) instead of opening a new one per call.
+        The caller must call ``close()`` when done.
+        """
+        if self._connection is None:
+            self._connection = await self._open_connection()
+
+    async def close(self) -> None:
+        """Close the persistent connection, if open."""
+        if self._connection is not None:
+            # Wait for the block using the connection, and any already queued
+            # behind it, before taking the connection away
+            async with self._lock:
+                conn, self._connection = self._connection, None
+                if conn is not None:
+                    await conn.close()
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open and configure a new database connection."""
         conn = await aiosqlite.connect(self.db_path)
         conn.row_factory = aiosqlite.Row
         # Enable foreign keys
         await conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Get a database connection as an async context manager.
+
+        Uses the persistent connection if one is open, otherwise opens a
+        connection for the duration of the block. A call still waiting for the
+        persistent connection when it is closed falls back to its own.
+        """
+        if self._connection is not None:
+            async with self._lock:
+                # close() may have run while this call waited for the lock
+                shared = self._connection
+                if shared is not None:
+                    try:
+                        yield shared
+                    except BaseException:
+                        # Don't leave a half-finished transaction on the shared connection
+                        await shared.rollback()
+                        raise
+                    return
+
+        conn = await self._open_connection()
         try:
             yield conn
         finally:
@@ -139,16 +217,18 @@ class DatabaseManager:
         metadata_json = json.dumps(metadata) if metadata else None
 
         async with self.connect() as conn:
-            await conn.execute(
+            cursor = await conn.execute(
                 """
                 INSERT INTO sessions (id, name, project_path, created_at, updated_at, metadata)
                 VALUES (?, ?, ?, ?, ?, ?)
+                RETURNING *
                 """,
                 (session_id, name, project_path, now, now, metadata_json),
             )
+            row = await cursor.fetchone()
             await conn.commit()
 
-        return await self.get_session(session_id)
+        return dict(row)
 
     async def get_session(self, session_id: str) -> Optional[dict]:
         """Get a session by ID."""
@@ -188,13 +268,14 @@ class DatabaseManager:
         params.append(session_id)
 
         async with self.connect() as conn:
-            await conn.execute(
-                f"UPDATE sessions SET {', '.join(updates)} WHERE id = ?",
+            cursor = await conn.execute(
+                f"UPDATE sessions SET {', '.join(updates)} WHERE id = ? RETURNING *",
                 tuple(params),
             )
+            row = await cursor.fetchone()
             await conn.commit()
 
-        return await self.get_session(session_id)
+        return dict(row) if row is not None else None
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session and all its messages."""
@@ -204,16 +285,30 @@ class DatabaseManager:
             return cursor.rowcount > 0
 
     async def search_sessions(self, query: str) -> list[dict]:
-        """Search sessions by name or message content."""
-        search_pattern = f"%{query}%"
+        """Search sessions by name or message content.
+
+        Uses the FTS5 indexes, so each word in the query matches as a token
+        prefix ("auth" finds "Authentication") rather than as an arbitrary
+        substring. An empty query returns all sessions.
+        """
+        match_query = _build_fts_query(query)
+        if match_query is None:
+            return await self.fetch_all("SELECT * FROM sessions ORDER BY updated_at DESC")
+
         return await self.fetch_all(
             """
-            SELECT DISTINCT s.* FROM sessions s
-            LEFT JOIN messages m ON s.id = m.session_id
-            WHERE s.name LIKE ? OR m.content LIKE ?
+            SELECT s.* FROM sessions s
+            WHERE s.rowid IN (
+                SELECT rowid FROM sessions_fts WHERE sessions_fts MATCH ?
+            )
+            OR s.id IN (
+                SELECT m.session_id FROM messages m
+                JOIN messages_fts f ON m.rowid = f.rowid
+                WHERE messages_fts MATCH ?
+            )
             ORDER BY s.updated_at DESC
             """,
-            (search_pattern, search_pattern),
+            (match_query, match_query),
         )
 
     # Message operations
@@ -232,14 +327,16 @@ class DatabaseManager:
         now = datetime.now(UTC).isoformat()
 
         async with self.connect() as conn:
-            await conn.execute(
+            cursor = await conn.execute(
                 """
                 INSERT INTO messages
                 (id, session_id, role, model, content, tokens_used, cost_estimate, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING *
                 """,
                 (message_id, session_id, role, model, content, tokens_used, cost_estimate, now),
             )
+            row = await cursor.fetchone()
             # Update session's updated_at
             await conn.execute(
                 "UPDATE sessions SET updated_at = ? WHERE id = ?",
@@ -247,7 +344,7 @@ class DatabaseManager:
             )
             await conn.commit()
 
-        return await self.get_message(message_id)
+        return dict(row)
 
     async def get_message(self, message_id: str) -> Optional[dict]:
         """Get a message by ID."""
@@ -270,6 +367,57 @@ class DatabaseManager:
 
         return await self.fetch_all(query, params)
 
+    async def get_session_messages_with_tool_calls(
+        self, session_id: str, limit: Optional[int] = None
+    ) -> list[dict]:
+        """Get all messages for a session along with their tool calls.
+
+        Tool calls are aggregated into a JSON array per message by SQLite, so
+        the whole transcript loads in one query instead of one query per
+        message.
+
+        Args:
+            session_id: Session ID
+            limit: Optional maximum number of messages
+
+        Returns:
+            Messages in chronological order, each with a ``tool_calls`` list
+            of tool call rows (as returned by ``get_message_tool_calls``)
+        """
+        query = """
+            SELECT m.*, (
+                SELECT json_group_array(json_object(
+                    'id', tc.id,
+                    'message_id', tc.message_id,
+                    'tool_name', tc.tool_name,
+                    'parameters', tc.parameters,
+                    'result', tc.result,
+                    'status', tc.status,
+                    'executed_at', tc.executed_at
+                ))
+                FROM tool_calls tc
+                WHERE tc.message_id = m.id
+            ) AS tool_calls_json
+            FROM messages m
+            WHERE m.session_id = ?
+            ORDER BY m.created_at ASC
+        """
+        params: tuple = (session_id,)
+
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (session_id, limit)
+
+        rows = await self.fetch_all(query, params)
+        for row in rows:
+            # SQLite doesn't define the order json_group_array sees its rows
+            # in, so sort like get_message_tool_calls (NULL executed_at first)
+            row["tool_calls"] = sorted(
+                json.loads(row.pop("tool_calls_json")),
+                key=lambda tc: (tc["executed_at"] is not None, tc["executed_at"] or ""),
+            )
+        return rows
+
     async def pin_message(self, session_id: str, message_id: str, pin_id: str) -> None:
         """Pin a message to a session's context."""
         now = datetime.now(UTC).isoformat()
@@ -326,11 +474,12 @@ class DatabaseManager:
         now = datetime.now(UTC).isoformat() if status != "pending" else None
 
         async with self.connect() as conn:
-            await conn.execute(
+            cursor = await conn.execute(
                 """
                 INSERT INTO tool_calls
                 (id, message_id, tool_name, parameters, result, status, executed_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
+                RETURNING *
                 """,
                 (
                     tool_call_id,
@@ -342,9 +491,10 @@ class DatabaseManager:
                     now,
                 ),
             )
+            row = await cursor.fetchone()
             await conn.commit()
 
-        return await self.get_tool_call(tool_call_id)
+        return dict(row)
 
     async def get_tool_call(self, tool_call_id: str) -> Optional[dict]:
         """Get a tool call by ID."""
@@ -373,13 +523,14 @@ class DatabaseManager:
         params.append(tool_call_id)
 
         async with self.connect() as conn:
-            await conn.execute(
-                f"UPDATE tool_calls SET {', '.join(updates)} WHERE id = ?",
+            cursor = await conn.execute(
+                f"UPDATE tool_calls SET {', '.join(updates)} WHERE id = ? RETURNING *",
                 tuple(params),
             )
+            row = await cursor.fetchone()
             await conn.commit()
 
-        return await self.get_tool_call(tool_call_id)
+        return dict(row) if row is not None else None
 
     async def get_message_tool_calls(self, message_id: str) -> list[dict]:
         """Get all tool calls for a message."""
@@ -390,11 +541,56 @@ class DatabaseManager:
 
     # Batch operations
 
+    async def batch_create_sessions(
+        self,
+        sessions: list[dict],
+    ) -> list[str]:
+        """Create multiple sessions in a single transaction.
+
+        Args:
+            sessions: List of session dictionaries with keys:
+                - id: Session ID
+                - name: Optional session name
+                - project_path: Optional project path
+                - metadata: Optional metadata dictionary
+
+        Returns:
+            List of created session IDs
+        """
+        if not sessions:
+            return []
+
+        now = datetime.now(UTC).isoformat()
+        rows = [
+            (
+                session["id"],
+                session.get("name"),
+                session.get("project_path"),
+                now,
+                now,
+                json.dumps(session["metadata"]) if session.get("metadata") else None,
+            )
+            for session in sessions
+        ]
+
+        async with self.connect() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO sessions (id, name, project_path, created_at, updated_at, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            await conn.commit()
+
+        return [session["id"] for session in sessions]
+
     async def batch_add_messages(
         self,
         messages: list[dict],
+        tool_calls: Optional[list[dict]] = None,
     ) -> list[str]:
-        """Add multiple messages in a single transaction.
+        """Add multiple messages, and optionally their tool calls, in a single transaction.
 
         Args:
             messages: List of message dictionaries with keys:
@@ -405,6 +601,10 @@ class DatabaseManager:
                 - model: Optional model name
                 - tokens_used: Optional token count
                 - cost_estimate: Optional cost
+                - created_at: Optional ISO timestamp (defaults to now)
+                - is_pinned: Optional flag to pin the message to its session
+            tool_calls: Optional tool calls for these messages, in the format
+                taken by ``batch_add_tool_calls``
 
         Returns:
             List of created message IDs
@@ -413,36 +613,52 @@ class DatabaseManager:
             return []
 
         now = datetime.now(UTC).isoformat()
-        session_ids = set()
+        rows = [
+            (
+                msg["id"],
+                msg["session_id"],
+                msg["role"],
+                msg.get("model"),
+                msg["content"],
+                msg.get("tokens_used"),
+                msg.get("cost_estimate"),
+                msg.get("created_at") or now,
+                bool(msg.get("is_pinned")),
+            )
+            for msg in messages
+        ]
+        pin_rows = [
+            (str(uuid.uuid4()), msg["session_id"], msg["id"], now)
+            for msg in messages
+            if msg.get("is_pinned")
+        ]
+        session_ids = {msg["session_id"] for msg in messages}
 
         async with self.connect() as conn:
-            for msg in messages:
-                await conn.execute(
+            await conn.executemany(
+                """
+                INSERT INTO messages
+                (id, session_id, role, model, content, tokens_used, cost_estimate, created_at,
+                 is_pinned)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            if pin_rows:
+                await conn.executemany(
                     """
-                    INSERT INTO messages
-                    (id, session_id, role, model, content, tokens_used, cost_estimate, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    INSERT INTO pinned_context (id, session_id, message_id, pinned_at)
+                    VALUES (?, ?, ?, ?)
                     """,
-                    (
-                        msg["id"],
-                        msg["session_id"],
-                        msg["role"],
-                        msg.get("model"),
-                        msg["content"],
-                        msg.get("tokens_used"),
-                        msg.get("cost_estimate"),
-                        now,
-                    ),
+                    pin_rows,
                 )
-                session_ids.add(msg["session_id"])
-
             # Update session timestamps
-            for session_id in session_ids:
-                await conn.execute(
-                    "UPDATE sessions SET updated_at = ? WHERE id = ?",
-                    (now, session_id),
-                )
-
+            await conn.executemany(
+                "UPDATE sessions SET updated_at = ? WHERE id = ?",
+                [(now, session_id) for session_id in session_ids],
+            )
+            if tool_calls:
+                await self._insert_tool_calls(conn, tool_calls)
             await conn.commit()
 
         return [msg["id"] for msg in messages]
@@ -469,29 +685,36 @@ class DatabaseManager:
             return []
 
         async with self.connect() as conn:
-            for tc in tool_calls:
-                executed_at = datetime.now(UTC).isoformat() if tc.get("status") != "pending" else None
-                await conn.execute(
-                    """
-                    INSERT INTO tool_calls
-                    (id, message_id, tool_name, parameters, result, status, executed_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        tc["id"],
-                        tc["message_id"],
-                        tc["tool_name"],
-                        json.dumps(tc.get("parameters")) if tc.get("parameters") else None,
-                        json.dumps(tc.get("result")) if tc.get("result") else None,
-                        tc.get("status", "pending"),
-                        executed_at,
-                    ),
-                )
-
+            await self._insert_tool_calls(conn, tool_calls)
             await conn.commit()
 
         return [tc["id"] for tc in tool_calls]
 
+    @staticmethod
+    async def _insert_tool_calls(conn: aiosqlite.Connection, tool_calls: list[dict]) -> None:
+        """Insert tool call rows on an open connection, leaving the commit to the caller."""
+        now = datetime.now(UTC).isoformat()
+        rows = [
+            (
+                tc["id"],
+                tc["message_id"],
+                tc["tool_name"],
+                json.dumps(tc.get("parameters")) if tc.get("parameters") else None,
+                json.dumps(tc.get("result")) if tc.get("result") else None,
+                tc.get("status", "pending"),
+                now if tc.get("status") != "pending" else None,
+            )
+            for tc in tool_calls
+        ]
+        await conn.executemany(
+            """
+            INSERT INTO tool_calls
+            (id, message_id, tool_name, parameters, result, status, executed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
     async def get_messages_by_model(
         self,
         session_id: str,
@@ -670,12 +893,13 @@ class DatabaseManager:
         now = datetime.now(UTC).isoformat()
 
         async with self.connect() as conn:
-            await conn.execute(
+            cursor = await conn.execute(
                 """
                 INSERT INTO summaries
                 (id, session_id, summary_type, content, message_range_start,
                  message_range_end, token_count, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING *
                 """,
                 (
                     summary_id,
@@ -688,9 +912,10 @@ class DatabaseManager:
                     now,
                 ),
             )
+            row = await cursor.fetchone()
             await conn.commit()
 
-        return await self.get_summary(summary_id)
+        return dict(row)
 
     async def get_summary(self, summary_id: str) -> Optional[dict]:
         """Get a summary by ID."""
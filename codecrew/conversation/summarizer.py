@@ -16,7 +16,7 @@ from typing import TYPE_CHECKING, Optional
 
 from pydantic import BaseModel, Field
 
-from codecrew.models.base import ModelClient
+from codecrew.models.base import ContentTokenCache, ModelClient
 from codecrew.models.types import Message
 
 from .persistence import DatabaseManager
@@ -86,6 +86,9 @@ class SummaryManager:
         self._summarizer: Optional["ContextSummarizer"] = None
         self.token_threshold = token_threshold
         self.summary_target_tokens = summary_target_tokens
+        # The check runs after every turn over the whole conversation, so each
+        # message's content is counted once and only new ones hit the tokenizer
+        self._content_tokens = ContentTokenCache()
 
         if summarizer_client:
             self._summarizer = ContextSummarizer(summarizer_client)
@@ -126,16 +129,18 @@ class SummaryManager:
             return None
 
         # Estimate current token count
-        total_tokens = sum(
-            token_counter.count_tokens(m.content) + 4  # +4 for role overhead
-            for m in messages
-        )
+        total_tokens = sum(self._content_tokens.count_all(messages, token_counter))
+        total_tokens += 4 * len(messages)  # Role overhead
 
         if total_tokens < self.token_threshold:
-            logger.debug(f"Token count {total_tokens} below threshold {self.token_threshold}")
+            logger.debug("Token count %d below threshold %d", total_tokens, self.token_threshold)
             return None
 
-        logger.info(f"Token threshold exceeded ({total_tokens}/{self.token_threshold}), generating summary")
+        logger.info(
+            "Token threshold exceeded (%d/%d), generating summary",
+            total_tokens,
+            self.token_threshold,
+        )
 
         # Determine what to summarize
         # Strategy: Summarize the older half of messages
@@ -86,12 +86,12 @@ def get_client(
     Raises:
         ValueError: If model name is not recognized
     """
-    if name not in MODEL_CLIENTS:
+    try:
+        client_class = MODEL_CLIENTS[name]
+    except KeyError:
         raise ValueError(
             f"Unknown model: {name}. Available models: {list(MODEL_CLIENTS.keys())}"
-        )
-
-    client_class = MODEL_CLIENTS[name]
+        ) from None
 
     kwargs = {}
     if api_key is not None:
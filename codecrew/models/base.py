@@ -3,8 +3,9 @@
 import asyncio
 import json
 import logging
+import weakref
 from abc import ABC, abstractmethod
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, AsyncIterator, Callable, Optional, TypeVar
 
 from .tools import ToolDefinition
@@ -23,6 +24,32 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=256)
+def _parse_should_speak_cached(content: str) -> ShouldSpeakResult:
+    """Parse a should_speak JSON response, caching results by raw text.
+
+    ShouldSpeakResult is frozen, so cached results are safe to share.
+    """
+    # Try to extract JSON from response
+    content = content.strip()
+
+    # Handle markdown code blocks: drop the opening fence line and closing fence
+    if content.startswith("```"):
+        content = content[content.find("\n") + 1 :].removesuffix("```")
+
+    try:
+        data = json.loads(content)
+        return ShouldSpeakResult(
+            should_speak=bool(data.get("should_speak", True)),
+            confidence=float(data.get("confidence", 0.5)),
+            reason=str(data.get("reason", "")),
+        )
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.warning(f"Failed to parse should_speak response: {content[:100]}... Error: {e}")
+        # Default to speaking if we can't parse
+        return ShouldSpeakResult.yes(confidence=0.5, reason="Could not parse response")
+
+
 class ModelError(Exception):
     """Base exception for model errors."""
 
@@ -125,6 +152,76 @@ Respond with ONLY a JSON object (no markdown, no explanation):
 {{"should_speak": true/false, "confidence": 0.0-1.0, "reason": "brief explanation"}}"""
 
 
+class ContentTokenCache:
+    """Per-model token counts of message content, kept while each message lives.
+
+    Message content is not modified after creation, so each message is counted
+    once per model. Entries are keyed by ``id(message)`` and dropped when the
+    message is garbage collected, so a recycled id never reads a stale count.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[tuple[int, str], tuple[weakref.ref[Message], int]] = {}
+
+    def count(self, message: Message, model: "ModelClient") -> int:
+        """Count the tokens in one message's content.
+
+        Args:
+            message: Message whose content to count
+            model: Model client whose tokenizer to use
+
+        Returns:
+            Token count for the message content
+        """
+        tokens = self._get(message, model.model_id)
+        if tokens is None:
+            tokens = model.count_tokens(message.content)
+            self._store(message, model.model_id, tokens)
+        return tokens
+
+    def count_all(self, messages: list[Message], model: "ModelClient") -> list[int]:
+        """Count the tokens in each message's content, batching uncached ones.
+
+        Args:
+            messages: Messages whose content to count
+            model: Model client whose tokenizer to use
+
+        Returns:
+            Token count for each message's content, in order
+        """
+        counts: list[int] = []
+        pending: list[int] = []
+        for i, msg in enumerate(messages):
+            tokens = self._get(msg, model.model_id)
+            if tokens is None:
+                pending.append(i)
+            counts.append(tokens or 0)
+
+        if pending:
+            fresh = model.count_tokens_batch([messages[i].content for i in pending])
+            for i, tokens in zip(pending, fresh):
+                self._store(messages[i], model.model_id, tokens)
+                counts[i] = tokens
+        return counts
+
+    def _get(self, message: Message, model_id: str) -> Optional[int]:
+        """Return the cached count for a live message, or None."""
+        entry = self._counts.get((id(message), model_id))
+        if entry is not None and entry[0]() is message:
+            return entry[1]
+        return None
+
+    def _store(self, message: Message, model_id: str, tokens: int) -> None:
+        """Remember a count until its message is garbage collected."""
+        key = (id(message), model_id)
+        counts = self._counts
+
+        def drop(_: weakref.ref[Message]) -> None:
+            counts.pop(key, None)
+
+        counts[key] = (weakref.ref(message, drop), tokens)
+
+
 class ModelClient(ABC):
     """Abstract base class for AI model clients.
 
@@ -226,6 +323,19 @@ class ModelClient(ABC):
         """
         ...
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Count the number of tokens in each of several texts.
+
+        Subclasses with a native batch tokenizer should override this.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Approximate token count for each text, in order
+        """
+        return [self.count_tokens(text) for text in texts]
+
     async def should_speak(
         self,
         conversation: list[Message],
@@ -287,25 +397,7 @@ class ModelClient(ABC):
 
     def _parse_should_speak_response(self, content: str) -> ShouldSpeakResult:
         """Parse the JSON response from should_speak evaluation."""
-        # Try to extract JSON from response
-        content = content.strip()
-
-        # Handle markdown code blocks
-        if content.startswith("```"):
-            lines = content.split("\n")
-            content = "\n".join(lines[1:-1])
-
-        try:
-            data = json.loads(content)
-            return ShouldSpeakResult(
-                should_speak=bool(data.get("should_speak", True)),
-                confidence=float(data.get("confidence", 0.5)),
-                reason=str(data.get("reason", "")),
-            )
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            logger.warning(f"Failed to parse should_speak response: {content[:100]}... Error: {e}")
-            # Default to speaking if we can't parse
-            return ShouldSpeakResult.yes(confidence=0.5, reason="Could not parse response")
+        return _parse_should_speak_cached(content)
 
     def _format_messages_for_logging(self, messages: list[Message]) -> str:
         """Format messages for debug logging."""
@@ -69,6 +69,14 @@ class ClaudeClient(ModelClient):
     def is_available(self) -> bool:
         return self.api_key is not None
 
+    def _system_blocks(self, system: str) -> list[dict[str, Any]]:
+        """Wrap the system prompt as a text block marked for prompt caching.
+
+        The cache breakpoint covers tools and the system prompt, so turns that
+        share them reuse the cached prefix instead of reprocessing it.
+        """
+        return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
     def _convert_messages(
         self, messages: list[Message], system: Optional[str] = None
     ) -> tuple[Optional[str], list[dict[str, Any]]]:
@@ -240,7 +248,7 @@ class ClaudeClient(ModelClient):
         }
 
         if system_content:
-            kwargs["system"] = system_content
+            kwargs["system"] = self._system_blocks(system_content)
 
         if temperature is not None:
             kwargs["temperature"] = temperature
@@ -279,7 +287,7 @@ class ClaudeClient(ModelClient):
         }
 
         if system_content:
-            kwargs["system"] = system_content
+            kwargs["system"] = self._system_blocks(system_content)
 
         if temperature is not None:
             kwargs["temperature"] = temperature
@@ -395,3 +395,10 @@ class GPTClient(ModelClient):
         if encoding:
             return len(encoding.encode(text))
         return self.estimate_tokens(text)
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens for several texts with one tiktoken batch call."""
+        encoding = self._get_encoding()
+        if encoding:
+            return [len(tokens) for tokens in encoding.encode_batch(texts)]
+        return [self.estimate_tokens(text) for text in texts]
@@ -1,12 +1,33 @@
 """Tool definitions with provider-specific translations."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from functools import wraps
+from typing import Any, Callable, Optional
 
 
-@dataclass
+def _cached_conversion(
+    method: Callable[["ToolDefinition"], dict[str, Any]],
+) -> Callable[["ToolDefinition"], dict[str, Any]]:
+    """Cache a ToolDefinition conversion on the instance after the first call."""
+    key = f"_{method.__name__}_result"
+
+    @wraps(method)
+    def wrapper(self: "ToolDefinition") -> dict[str, Any]:
+        try:
+            result: dict[str, Any] = self.__dict__[key]
+        except KeyError:
+            result = self.__dict__[key] = method(self)
+        return result
+
+    return wrapper
+
+
+@dataclass(frozen=True, slots=True)
 class ToolParameter:
-    """A parameter for a tool."""
+    """A parameter for a tool.
+
+    The JSON schema is built once at construction; treat it as read-only.
+    """
 
     name: str
     type: str  # 'string', 'integer', 'number', 'boolean', 'array', 'object'
@@ -15,9 +36,10 @@ class ToolParameter:
     enum: Optional[list[str]] = None
     items: Optional[dict[str, Any]] = None  # For array types
     properties: Optional[dict[str, Any]] = None  # For object types
+    _schema: dict[str, Any] = field(init=False, repr=False, compare=False)
 
-    def to_json_schema(self) -> dict[str, Any]:
-        """Convert to JSON Schema format."""
+    def __post_init__(self) -> None:
+        """Build the JSON schema from the parameter's fields."""
         schema: dict[str, Any] = {
             "type": self.type,
             "description": self.description,
@@ -28,17 +50,28 @@ class ToolParameter:
             schema["items"] = self.items
         if self.properties:
             schema["properties"] = self.properties
-        return schema
+        object.__setattr__(self, "_schema", schema)
+
+    def to_json_schema(self) -> dict[str, Any]:
+        """Convert to JSON Schema format."""
+        return self._schema
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class ToolDefinition:
-    """Definition of a tool that can be called by models."""
+    """Definition of a tool that can be called by models.
+
+    Definitions are immutable, so each provider conversion is built once and
+    reused. The returned payloads are shared by every caller and must be
+    treated as read-only. Definitions compare and hash by identity, since
+    ``parameters`` is a list and the conversions are cached per instance.
+    """
 
     name: str
     description: str
     parameters: list[ToolParameter] = field(default_factory=list)
 
+    @_cached_conversion
     def _build_json_schema(self) -> dict[str, Any]:
         """Build JSON schema for parameters."""
         properties = {}
@@ -58,6 +91,7 @@ class ToolDefinition:
 
         return schema
 
+    @_cached_conversion
     def to_anthropic(self) -> dict[str, Any]:
         """Convert to Anthropic tool format.
 
@@ -78,6 +112,7 @@ class ToolDefinition:
             "input_schema": self._build_json_schema(),
         }
 
+    @_cached_conversion
     def to_openai(self) -> dict[str, Any]:
         """Convert to OpenAI function/tool format.
 
@@ -104,6 +139,7 @@ class ToolDefinition:
             },
         }
 
+    @_cached_conversion
     def to_google(self) -> dict[str, Any]:
         """Convert to Google Gemini function declaration format.
 
@@ -131,21 +167,29 @@ class ToolDefinition:
 
 def tools_to_anthropic(tools: list[ToolDefinition]) -> list[dict[str, Any]]:
     """Convert a list of tools to Anthropic format."""
+    if tools is DEFAULT_TOOLS:
+        return DEFAULT_TOOLS_ANTHROPIC
     return [tool.to_anthropic() for tool in tools]
 
 
 def tools_to_openai(tools: list[ToolDefinition]) -> list[dict[str, Any]]:
     """Convert a list of tools to OpenAI format."""
+    if tools is DEFAULT_TOOLS:
+        return DEFAULT_TOOLS_OPENAI
     return [tool.to_openai() for tool in tools]
 
 
 def tools_to_google(tools: list[ToolDefinition]) -> list[dict[str, Any]]:
     """Convert a list of tools to Google format."""
+    if tools is DEFAULT_TOOLS:
+        return DEFAULT_TOOLS_GOOGLE
     return [tool.to_google() for tool in tools]
 
 
 def tools_to_xai(tools: list[ToolDefinition]) -> list[dict[str, Any]]:
     """Convert a list of tools to xAI format."""
+    if tools is DEFAULT_TOOLS:
+        return DEFAULT_TOOLS_XAI
     return [tool.to_xai() for tool in tools]
 
 
@@ -492,6 +536,12 @@ DEFAULT_TOOLS = [
     LIST_DIRECTORY_TOOL,
 ]
 
+# Provider payloads for the default tools, built once at import
+DEFAULT_TOOLS_ANTHROPIC = [tool.to_anthropic() for tool in DEFAULT_TOOLS]
+DEFAULT_TOOLS_OPENAI = [tool.to_openai() for tool in DEFAULT_TOOLS]
+DEFAULT_TOOLS_GOOGLE = [tool.to_google() for tool in DEFAULT_TOOLS]
+DEFAULT_TOOLS_XAI = [tool.to_xai() for tool in DEFAULT_TOOLS]
+
 # Git tools (separate list for optional registration)
 GIT_TOOLS = [
     GIT_STATUS_TOOL,
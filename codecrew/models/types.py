@@ -1,11 +1,13 @@
 """Unified message and response types for all model providers."""
 
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Optional
+from enum import StrEnum
+from functools import cached_property
+from hashlib import blake2b
+from typing import Any, Iterable, Optional
 
 
-class MessageRole(str, Enum):
+class MessageRole(StrEnum):
     """Role of a message sender."""
 
     USER = "user"
@@ -14,7 +16,7 @@ class MessageRole(str, Enum):
     TOOL = "tool"
 
 
-class FinishReason(str, Enum):
+class FinishReason(StrEnum):
     """Reason why the model stopped generating."""
 
     STOP = "stop"
@@ -24,7 +26,7 @@ class FinishReason(str, Enum):
     CONTENT_FILTER = "content_filter"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """A tool call made by an AI model."""
 
@@ -33,7 +35,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from executing a tool."""
 
@@ -44,7 +46,11 @@ class ToolResult:
 
 @dataclass
 class Message:
-    """A message in a conversation."""
+    """A message in a conversation.
+
+    Messages are mutable (the orchestrator attaches tool calls after the
+    response completes), so the factory methods always return a new instance.
+    """
 
     role: MessageRole
     content: str
@@ -52,6 +58,24 @@ class Message:
     model: Optional[str] = None  # Which model generated this (for assistant messages)
     tool_calls: list[ToolCall] = field(default_factory=list)
     tool_results: list[ToolResult] = field(default_factory=list)
+    # Role predicates, derived once from role
+    is_user_message: bool = field(init=False, repr=False, compare=False)
+    is_assistant_message: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the role predicates from the role."""
+        self.is_user_message = self.role == MessageRole.USER
+        self.is_assistant_message = self.role == MessageRole.ASSISTANT
+
+    @cached_property
+    def stable_id(self) -> str:
+        """Content-derived ID used to pin messages.
+
+        Unlike ``id(message)`` this survives copies and process restarts.
+        Messages with the same role and content share an ID.
+        """
+        key = self.role.value.encode() + b"\x00" + self.content.encode()
+        return blake2b(key, digest_size=16).hexdigest()
 
     @classmethod
     def user(cls, content: str) -> "Message":
@@ -98,18 +122,8 @@ class Message:
             tool_results=results,
         )
 
-    @property
-    def is_user_message(self) -> bool:
-        """Check if this is a user message."""
-        return self.role == MessageRole.USER
-
-    @property
-    def is_assistant_message(self) -> bool:
-        """Check if this is an assistant message."""
-        return self.role == MessageRole.ASSISTANT
-
 
-@dataclass
+@dataclass(slots=True)
 class Usage:
     """Token usage information."""
 
@@ -131,8 +145,26 @@ class Usage:
             ),
         )
 
+    @classmethod
+    def sum(cls, items: Iterable["Usage"]) -> "Usage":
+        """Add up many usage objects without building intermediate totals."""
+        prompt_tokens = completion_tokens = total_tokens = 0
+        cost_estimate: Optional[float] = None
+        for usage in items:
+            prompt_tokens += usage.prompt_tokens
+            completion_tokens += usage.completion_tokens
+            total_tokens += usage.total_tokens
+            if usage.cost_estimate is not None:
+                cost_estimate = (cost_estimate or 0) + usage.cost_estimate
+        return cls(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+            cost_estimate=cost_estimate,
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class ModelResponse:
     """Response from an AI model."""
 
@@ -149,7 +181,7 @@ class ModelResponse:
         return len(self.tool_calls) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """A chunk from a streaming response."""
 
@@ -160,7 +192,7 @@ class StreamChunk:
     usage: Optional[Usage] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class ShouldSpeakResult:
     """Result from a model deciding whether to speak."""
 
@@ -207,13 +239,15 @@ MODEL_COSTS = {
 }
 
 
+# Per-token (input, output) rates, derived once from MODEL_COSTS
+_PER_TOKEN_COSTS: dict[str, tuple[float, float]] = {
+    model_id: (input_cost / 1_000_000, output_cost / 1_000_000)
+    for model_id, (input_cost, output_cost) in MODEL_COSTS.items()
+}
+
+
 def estimate_cost(model_id: str, usage: Usage) -> float:
     """Estimate cost based on model and usage."""
-    if model_id not in MODEL_COSTS:
-        return 0.0
-
-    input_cost, output_cost = MODEL_COSTS[model_id]
-    cost = (usage.prompt_tokens / 1_000_000 * input_cost) + (
-        usage.completion_tokens / 1_000_000 * output_cost
-    )
+    input_rate, output_rate = _PER_TOKEN_COSTS.get(model_id, (0.0, 0.0))
+    cost = usage.prompt_tokens * input_rate + usage.completion_tokens * output_rate
     return round(cost, 6)
@@ -26,12 +26,14 @@ from .mentions import (
 )
 from .persistent import PersistentOrchestrator, create_persistent_orchestrator
 from .prompts import (
+    BATCH_SHOULD_SPEAK_PROMPT,
     MODEL_PROFILES,
     ModelProfile,
     SHOULD_SPEAK_PROMPT,
     SHOULD_SPEAK_PROMPT_V2,
     SYSTEM_PROMPT_TEMPLATE,
     SYSTEM_PROMPT_TEMPLATE_V2,
+    format_batch_should_speak_prompt,
     format_should_speak_prompt,
     format_system_prompt,
     get_model_profile,
@@ -83,9 +85,11 @@ __all__ = [
     # Prompts
     "SHOULD_SPEAK_PROMPT",
     "SHOULD_SPEAK_PROMPT_V2",
+    "BATCH_SHOULD_SPEAK_PROMPT",
     "SYSTEM_PROMPT_TEMPLATE",
     "SYSTEM_PROMPT_TEMPLATE_V2",
     "format_should_speak_prompt",
+    "format_batch_should_speak_prompt",
     "format_system_prompt",
     # Model profiles
     "ModelProfile",
@@ -8,10 +8,12 @@ Builds appropriate context windows for each model, handling:
 - Optional summarization for long conversations
 """
 
+import json
 import logging
+from functools import lru_cache
 from typing import Optional, Set
 
-from codecrew.models.base import ModelClient
+from codecrew.models.base import ContentTokenCache, ModelClient
 from codecrew.models.types import Message, MessageRole
 
 from .prompts import format_system_prompt
@@ -27,6 +29,42 @@ RESPONSE_RESERVE = 4096
 # Minimum tokens to keep for conversation (after system + pinned)
 MIN_CONVERSATION_TOKENS = 2000
 
+# Number of rendered system prompts (and their token counts) to keep
+SYSTEM_PROMPT_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=SYSTEM_PROMPT_CACHE_SIZE)
+def _render_system_prompt(
+    model_name: str,
+    other_models: tuple[str, ...],
+    additional_context: Optional[str],
+) -> str:
+    """Render a system prompt, reusing the result for repeated arguments."""
+    return format_system_prompt(
+        model_name=model_name,
+        other_models=list(other_models),
+        additional_context=additional_context,
+    )
+
+
+def _utf8_length(text: str) -> int:
+    """Return the UTF-8 byte length of text, without encoding ASCII text."""
+    return len(text) if text.isascii() else len(text.encode())
+
+
+def _max_message_tokens(message: Message) -> int:
+    """Upper bound on ContextAssembler's token estimate for a message.
+
+    Mirrors ``_estimate_message_tokens`` with every token count replaced by
+    the text's UTF-8 byte length.
+    """
+    tokens = _utf8_length(message.content) + 4
+    if message.model:
+        tokens += _utf8_length(message.model) + 2
+    for tc in message.tool_calls:
+        tokens += _utf8_length(tc.name) + 10 + _utf8_length(json.dumps(tc.arguments))
+    return tokens
+
 
 class ContextAssembler:
     """Assembles context windows tailored to each model's limits.
@@ -50,6 +88,9 @@ class ContextAssembler:
         """
         self.max_tokens = max_tokens
         self.response_reserve = response_reserve
+        self._content_tokens = ContentTokenCache()
+        # System prompt token counts keyed by (model id, prompt)
+        self._system_tokens: dict[tuple[str, str], int] = {}
 
     def assemble_for_model(
         self,
@@ -66,7 +107,7 @@ class ContextAssembler:
             conversation: Full conversation history
             model: The model client to assemble for
             other_models: Names of other models in the chat
-            pinned_ids: Message IDs that are pinned
+            pinned_ids: Stable IDs (``Message.stable_id``) of pinned messages
             include_system: Whether to include system prompt
             additional_context: Extra context to include in system prompt
 
@@ -79,26 +120,26 @@ class ContextAssembler:
         available = self.max_tokens - self.response_reserve
         current_tokens = 0
 
-        # 1. System prompt (if requested)
+        # 1. System prompt (if requested). Other models are sorted so the prompt
+        # prefix is byte-identical across turns and fan-out order, which keeps
+        # provider-side prompt caches warm; per-turn additional context is
+        # appended after it.
         system_prompt = None
         if include_system:
-            other_display_names = [
-                self._get_display_name(m) for m in other_models
-            ]
-            system_prompt = format_system_prompt(
-                model_name=model.display_name,
-                other_models=other_display_names,
-                additional_context=additional_context,
+            other_display_names = tuple(sorted(self._get_display_name(m) for m in other_models))
+            system_prompt = _render_system_prompt(
+                model.display_name,
+                other_display_names,
+                additional_context,
             )
-            current_tokens += model.count_tokens(system_prompt)
+            current_tokens += self._count_system_tokens(system_prompt, model)
 
         # 2. Separate pinned and regular messages
         pinned_messages = []
         regular_messages = []
 
         for msg in conversation:
-            msg_id = getattr(msg, "id", None) or str(id(msg))
-            if msg_id in pinned_ids:
+            if msg.stable_id in pinned_ids:
                 pinned_messages.append(msg)
             else:
                 regular_messages.append(msg)
@@ -118,16 +159,18 @@ class ContextAssembler:
         if remaining < MIN_CONVERSATION_TOKENS:
             remaining = MIN_CONVERSATION_TOKENS
 
-        # 5. Add recent messages (most recent first)
+        # 5. Add recent messages (most recent first), collected newest-first
+        # and reversed once rather than inserting at the head each time
         included_regular = []
         for msg in reversed(regular_messages):
             tokens = self._estimate_message_tokens(msg, model)
             if current_tokens + tokens < available:
-                included_regular.insert(0, msg)
+                included_regular.append(msg)
                 current_tokens += tokens
             else:
                 # Stop adding messages when we hit the limit
                 break
+        included_regular.reverse()
 
         # 6. Combine: pinned first (in order), then regular (chronological)
         result = included_pinned + included_regular
@@ -153,6 +196,8 @@ class ContextAssembler:
         Returns:
             Estimated token count
         """
+        # Count the content of all uncached messages in one batch call
+        self._content_tokens.count_all(messages, model)
         total = 0
         for msg in messages:
             total += self._estimate_message_tokens(msg, model)
@@ -175,7 +220,7 @@ class ContextAssembler:
             Estimated token count
         """
         # Base content tokens
-        tokens = model.count_tokens(message.content)
+        tokens = self._content_tokens.count(message, model)
 
         # Add overhead for role (typically 2-4 tokens)
         tokens += 4
@@ -189,11 +234,28 @@ class ContextAssembler:
             for tc in message.tool_calls:
                 tokens += model.count_tokens(tc.name) + 10
                 # Arguments as JSON string
-                import json
                 tokens += model.count_tokens(json.dumps(tc.arguments))
 
         return tokens
 
+    def _count_system_tokens(self, system_prompt: str, model: ModelClient) -> int:
+        """Count tokens in a system prompt, reusing earlier counts.
+
+        Args:
+            system_prompt: The rendered system prompt
+            model: Model whose tokenizer to use
+
+        Returns:
+            Token count for the prompt
+        """
+        key = (model.model_id, system_prompt)
+        tokens = self._system_tokens.get(key)
+        if tokens is None:
+            if len(self._system_tokens) >= SYSTEM_PROMPT_CACHE_SIZE:
+                self._system_tokens.clear()
+            tokens = self._system_tokens[key] = model.count_tokens(system_prompt)
+        return tokens
+
     def _get_display_name(self, model_name: str) -> str:
         """Get display name for a model.
 
@@ -229,9 +291,16 @@ class ContextAssembler:
         Returns:
             True if adding the message would exceed the limit
         """
+        available = self.max_tokens - self.response_reserve
+
+        # No tokenizer emits more tokens than the text has UTF-8 bytes, so if
+        # that bound fits there is no need to tokenize anything
+        upper_bound = sum(map(_max_message_tokens, conversation))
+        if upper_bound + _max_message_tokens(new_message) <= available:
+            return False
+
         current = self.estimate_tokens(conversation, model)
         new_tokens = self._estimate_message_tokens(new_message, model)
-        available = self.max_tokens - self.response_reserve
 
         return (current + new_tokens) > available
 
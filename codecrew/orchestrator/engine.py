@@ -10,7 +10,8 @@ The Orchestrator coordinates multi-model conversations by:
 
 import asyncio
 import logging
-from typing import AsyncIterator, Optional, Set
+import time
+from typing import AsyncIterator, Optional, Set, Union
 
 from codecrew.config import Settings
 from codecrew.models.base import ModelClient, ModelError
@@ -32,6 +33,60 @@ from .turns import TurnManager, TurnStrategy
 
 logger = logging.getLogger(__name__)
 
+# Streamed text is merged into one RESPONSE_CHUNK event until this many
+# characters are buffered or this many seconds have passed since the last one
+CHUNK_FLUSH_SIZE = 64
+CHUNK_FLUSH_INTERVAL = 0.016
+
+
+class _ChunkCoalescer:
+    """Merges streamed text chunks into fewer RESPONSE_CHUNK events.
+
+    Providers often stream a few characters at a time, and every event makes
+    the consumer re-render. Buffering on a small size/time budget keeps the
+    stream responsive while cutting the number of events.
+    """
+
+    def __init__(
+        self,
+        flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        """Initialize the coalescer.
+
+        Args:
+            flush_size: Buffered characters that trigger a flush
+                (defaults to CHUNK_FLUSH_SIZE)
+            flush_interval: Seconds since the last flush that trigger a flush
+                (defaults to CHUNK_FLUSH_INTERVAL)
+        """
+        self.flush_size = CHUNK_FLUSH_SIZE if flush_size is None else flush_size
+        self.flush_interval = CHUNK_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def add(self, content: str) -> Optional[str]:
+        """Buffer a chunk, returning the merged text if it is time to flush."""
+        self._parts.append(content)
+        self._size += len(content)
+        if (
+            self._size >= self.flush_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Return and clear the buffered text, or None if nothing is buffered."""
+        self._last_flush = time.monotonic()
+        if not self._parts:
+            return None
+        content = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        return content
+
 
 class Orchestrator:
     """Main orchestration engine for multi-model conversations.
@@ -67,9 +122,16 @@ class Orchestrator:
         ]
 
         # Initialize components
+        router: Optional[str] = None
+        if settings.conversation.batch_should_speak and self.available_models:
+            router = settings.conversation.router_model
+            if router not in self.available_models:
+                router = self.available_models[0]
+
         self.speaking_evaluator = SpeakingEvaluator(
             clients={k: v for k, v in clients.items() if v.is_available},
             silence_threshold=settings.conversation.silence_threshold,
+            router=router,
         )
 
         self.turn_manager = TurnManager(
@@ -100,13 +162,21 @@ class Orchestrator:
         """Get the set of pinned message IDs."""
         return self._pinned_ids
 
-    def pin_message(self, message_id: str) -> None:
-        """Pin a message to always include in context."""
-        self._pinned_ids.add(message_id)
+    def pin_message(self, message: Union[Message, str]) -> None:
+        """Pin a message to always include in context.
+
+        Args:
+            message: The message to pin, or its ``stable_id``
+        """
+        self._pinned_ids.add(message.stable_id if isinstance(message, Message) else message)
 
-    def unpin_message(self, message_id: str) -> None:
-        """Unpin a message."""
-        self._pinned_ids.discard(message_id)
+    def unpin_message(self, message: Union[Message, str]) -> None:
+        """Unpin a message.
+
+        Args:
+            message: The message to unpin, or its ``stable_id``
+        """
+        self._pinned_ids.discard(message.stable_id if isinstance(message, Message) else message)
 
     def add_message(self, message: Message) -> None:
         """Add a message to conversation history."""
@@ -168,7 +238,6 @@ class Orchestrator:
 
         # 6. Generate responses sequentially
         responses: list[ModelResponse] = []
-        total_usage = Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
 
         for model_name in speaking_order:
             async for event in self._generate_model_response(
@@ -182,11 +251,8 @@ class Orchestrator:
                 if event.type == EventType.RESPONSE_COMPLETE and event.response:
                     responses.append(event.response)
 
-                    # Accumulate usage
-                    if event.response.usage:
-                        total_usage = total_usage + event.response.usage
-
         # 7. Complete the turn
+        total_usage = Usage.sum(r.usage for r in responses if r.usage)
         yield OrchestratorEvent.turn_complete(
             responses=responses,
             usage=total_usage if total_usage.total_tokens > 0 else None,
@@ -291,6 +357,7 @@ class Orchestrator:
         tool_calls: list[ToolCall] = []
         finish_reason = FinishReason.STOP
         usage: Optional[Usage] = None
+        coalescer = _ChunkCoalescer()
 
         async for chunk in client.generate_stream(
             messages=messages,
@@ -298,9 +365,15 @@ class Orchestrator:
         ):
             if chunk.content:
                 content_buffer += chunk.content
-                yield OrchestratorEvent.response_chunk(model_name, chunk.content)
+                merged = coalescer.add(chunk.content)
+                if merged:
+                    yield OrchestratorEvent.response_chunk(model_name, merged)
 
             if chunk.tool_call:
+                # Keep text that preceded the tool call ahead of it
+                pending = coalescer.flush()
+                if pending:
+                    yield OrchestratorEvent.response_chunk(model_name, pending)
                 tool_calls.append(chunk.tool_call)
                 yield OrchestratorEvent.tool_call_event(model_name, chunk.tool_call)
 
@@ -308,6 +381,10 @@ class Orchestrator:
                 finish_reason = chunk.finish_reason or FinishReason.STOP
                 usage = chunk.usage
 
+        pending = coalescer.flush()
+        if pending:
+            yield OrchestratorEvent.response_chunk(model_name, pending)
+
         # Build complete response
         response = ModelResponse(
             content=content_buffer,
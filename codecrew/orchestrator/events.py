@@ -38,7 +38,7 @@ class EventType(Enum):
     TURN_COMPLETE = auto()  # All models done for this turn
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpeakerDecision:
     """Result of evaluating whether a model should speak."""
 
@@ -84,7 +84,7 @@ class SpeakerDecision:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestratorEvent:
     """Event emitted by the orchestrator during message processing.
 
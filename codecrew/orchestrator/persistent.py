@@ -100,8 +100,8 @@ class PersistentOrchestrator:
 
     @property
     def pinned_ids(self) -> Set[str]:
-        """Get pinned message IDs."""
-        return self._orchestrator.pinned_ids
+        """Get the database IDs of pinned messages."""
+        return self._conversation_manager.pinned_ids
 
     # ========== Session Management ==========
 
@@ -128,7 +128,7 @@ class PersistentOrchestrator:
         self._orchestrator.clear_conversation()
         self._pending_messages.clear()
 
-        logger.info(f"Created session: {session.id}")
+        logger.info("Created session: %s", session.id)
         return session.id
 
     async def load_session(self, session_id: str) -> None:
@@ -143,13 +143,15 @@ class PersistentOrchestrator:
         messages = await self._conversation_manager.load_as_orchestrator_messages()
         self._orchestrator.conversation = messages
 
-        # Restore pinned IDs
+        # Restore pins, keyed by the loaded messages' stable IDs
+        stable_ids = self._stable_ids_by_message_id()
         for pin_id in self._conversation_manager.pinned_ids:
-            self._orchestrator.pin_message(pin_id)
+            if pin_id in stable_ids:
+                self._orchestrator.pin_message(stable_ids[pin_id])
 
         self._pending_messages.clear()
 
-        logger.info(f"Loaded session: {session_id} ({len(messages)} messages)")
+        logger.info("Loaded session: %s (%d messages)", session_id, len(messages))
 
     async def ensure_session(
         self,
@@ -228,6 +230,7 @@ class PersistentOrchestrator:
         if not new_messages:
             return
 
+        usages: list[Optional[Usage]] = []
         for i, msg in enumerate(new_messages):
             # Calculate per-message usage (approximate for multi-model turns)
             msg_usage = None
@@ -250,9 +253,11 @@ class PersistentOrchestrator:
                         cost_estimate=turn_usage.cost_estimate / (len(new_messages) - 1) if turn_usage.cost_estimate and len(new_messages) > 1 else None,
                     )
 
-            await self._conversation_manager.persist_message(msg, usage=msg_usage)
+            usages.append(msg_usage)
 
-        logger.debug(f"Persisted {len(new_messages)} new messages")
+        await self._conversation_manager.persist_messages(new_messages, usages=usages)
+
+        logger.debug("Persisted %d new messages", len(new_messages))
 
     async def _check_summarization(self) -> None:
         """Check if summarization is needed and trigger if so."""
@@ -276,7 +281,7 @@ class PersistentOrchestrator:
         )
 
         if summary:
-            logger.info(f"Generated summary: {summary.id}")
+            logger.info("Generated summary: %s", summary.id)
 
     # ========== Pin Management ==========
 
@@ -290,7 +295,9 @@ class PersistentOrchestrator:
             True if pinned
         """
         # Update orchestrator
-        self._orchestrator.pin_message(message_id)
+        stable_id = self._stable_ids_by_message_id().get(message_id)
+        if stable_id is not None:
+            self._orchestrator.pin_message(stable_id)
 
         # Persist to database
         return await self._conversation_manager.pin_message(message_id)
@@ -305,11 +312,26 @@ class PersistentOrchestrator:
             True if unpinned
         """
         # Update orchestrator
-        self._orchestrator.unpin_message(message_id)
+        stable_id = self._stable_ids_by_message_id().get(message_id)
+        if stable_id is not None:
+            self._orchestrator.unpin_message(stable_id)
 
         # Persist to database
         return await self._conversation_manager.unpin_message(message_id)
 
+    def _stable_ids_by_message_id(self) -> dict[str, str]:
+        """Map database message IDs to the ``stable_id`` of each loaded message.
+
+        The orchestrator pins messages by ``Message.stable_id``, while the
+        persistence layer pins them by database ID.
+        """
+        stable_ids = {}
+        for message in self._orchestrator.conversation:
+            message_id = self._conversation_manager.get_message_id(message)
+            if message_id is not None:
+                stable_ids[message_id] = message.stable_id
+        return stable_ids
+
     # ========== Model Operations ==========
 
     async def retry_model(
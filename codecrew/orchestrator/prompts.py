@@ -7,10 +7,14 @@ These templates are used for:
 - Model personality profiles
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelProfile:
     """Profile defining a model's personality and expertise.
 
@@ -29,7 +33,7 @@ class ModelProfile:
 
 # Model-specific profiles - optimized for token efficiency
 # Based on patterns from Cursor, Claude Code, Windsurf, Devin, Manus
-MODEL_PROFILES: dict[str, ModelProfile] = {
+_MODEL_PROFILES: dict[str, ModelProfile] = {
     "claude": ModelProfile(
         name="claude",
         display_name="Claude",
@@ -140,7 +144,11 @@ MODEL_PROFILES: dict[str, ModelProfile] = {
     ),
 }
 
+# Read-only, since get_model_profile and the prompt caches memoize lookups
+MODEL_PROFILES: Mapping[str, ModelProfile] = MappingProxyType(_MODEL_PROFILES)
 
+
+@lru_cache(maxsize=32)
 def get_model_profile(model_name: str) -> ModelProfile | None:
     """Get the profile for a model by name.
 
@@ -152,6 +160,12 @@ def get_model_profile(model_name: str) -> ModelProfile | None:
     """
     return MODEL_PROFILES.get(model_name.lower())
 
+
+def _bullet_list(items: tuple[str, ...]) -> str:
+    """Render profile entries as a markdown bullet list."""
+    return "\n".join(f"- {item}" for item in items)
+
+
 # Template for determining if a model should contribute to the conversation
 SHOULD_SPEAK_PROMPT = """You are {model_name} participating in a collaborative group coding chat with other AI assistants ({other_models}).
 
@@ -182,6 +196,29 @@ Rules for confidence:
 - 0.3-0.4: Minimal value to add
 - 0.0-0.2: Would just be repeating others"""
 
+# Template for deciding, in a single call, which of several models should contribute
+BATCH_SHOULD_SPEAK_PROMPT = """You are moderating a collaborative group coding chat between AI assistants: {model_names}.
+
+CURRENT CONVERSATION:
+{conversation_history}
+
+USER'S LATEST MESSAGE:
+{user_message}
+
+{previous_responses_section}
+
+For EACH assistant, decide whether it should respond. An assistant should respond if it can add a genuinely different perspective, catch an error or important caveat, or add meaningful technical value. If the question is already well covered, it should stay SILENT.
+
+Respond with ONLY valid JSON (no markdown, no explanation), one entry per assistant:
+{{{example}}}
+
+Use the same confidence scale for every assistant:
+- 0.9-1.0: Critical/unique information others missed
+- 0.7-0.8: A valuable different perspective
+- 0.5-0.6: Might add some value
+- 0.3-0.4: Minimal value to add
+- 0.0-0.2: Would just be repeating others"""
+
 # Section template for previous responses (only included if there are responses)
 PREVIOUS_RESPONSES_TEMPLATE = """RESPONSES FROM OTHER MODELS IN THIS TURN:
 {responses}
@@ -298,6 +335,35 @@ Style: {communication_style}
 - ACT, DON'T ASK: If user mentions a path/file, read it immediately—don't ask for clarification"""
 
 
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a str.format template into (literal, field name) pairs once.
+
+    Rendering the pairs skips the format-string parsing that str.format
+    repeats on every call. Only plain ``{name}`` fields are supported.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported replacement field in template: {field_name!r}")
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def _render_template(parts: tuple[tuple[str, str | None], ...], **fields: str) -> str:
+    """Render a template compiled by ``_compile_template``."""
+    out = []
+    for literal, field_name in parts:
+        out.append(literal)
+        if field_name is not None:
+            out.append(fields[field_name])
+    return "".join(out)
+
+
+# Templates rendered on every turn, precompiled
+_SHOULD_SPEAK_PARTS = _compile_template(SHOULD_SPEAK_PROMPT)
+_SHOULD_SPEAK_V2_PARTS = _compile_template(SHOULD_SPEAK_PROMPT_V2)
+_BATCH_SHOULD_SPEAK_PARTS = _compile_template(BATCH_SHOULD_SPEAK_PROMPT)
+
 def format_should_speak_prompt(
     model_name: str,
     other_models: list[str],
@@ -332,18 +398,20 @@ def format_should_speak_prompt(
     profile = get_model_profile(model_name) if use_enhanced else None
 
     if profile:
-        return SHOULD_SPEAK_PROMPT_V2.format(
+        return _render_template(
+            _SHOULD_SPEAK_V2_PARTS,
             model_name=model_name,
             other_models=", ".join(other_models),
             conversation_history=conversation_history or "(No previous messages)",
             user_message=user_message,
             previous_responses_section=previous_section,
-            strength_areas="\n".join(f"- {area}" for area in profile.strength_areas),
-            silence_conditions="\n".join(f"- {cond}" for cond in profile.silence_conditions),
+            strength_areas=_bullet_list(profile.strength_areas),
+            silence_conditions=_bullet_list(profile.silence_conditions),
         )
 
     # Fall back to original template
-    return SHOULD_SPEAK_PROMPT.format(
+    return _render_template(
+        _SHOULD_SPEAK_PARTS,
         model_name=model_name,
         other_models=", ".join(other_models),
         conversation_history=conversation_history or "(No previous messages)",
@@ -352,6 +420,45 @@ def format_should_speak_prompt(
     )
 
 
+def format_batch_should_speak_prompt(
+    model_names: list[str],
+    conversation_history: str,
+    user_message: str,
+    previous_responses: list[tuple[str, str]] | None = None,
+) -> str:
+    """Format the prompt that decides for several models in one call.
+
+    Args:
+        model_names: Names of the models to decide for (also the JSON keys)
+        conversation_history: Formatted conversation history
+        user_message: The user's latest message
+        previous_responses: List of (model_name, response) tuples from earlier this turn
+
+    Returns:
+        Formatted prompt string
+    """
+    if previous_responses:
+        responses_text = "\n\n".join(
+            f"[{name}]: {response}" for name, response in previous_responses
+        )
+        previous_section = PREVIOUS_RESPONSES_TEMPLATE.format(responses=responses_text)
+    else:
+        previous_section = ""
+
+    example = ", ".join(
+        f'"{name}": {{"should_speak": true, "confidence": 0.7, "reason": "brief reason"}}'
+        for name in model_names
+    )
+    return _render_template(
+        _BATCH_SHOULD_SPEAK_PARTS,
+        model_names=", ".join(model_names),
+        conversation_history=conversation_history or "(No previous messages)",
+        user_message=user_message,
+        previous_responses_section=previous_section,
+        example=example,
+    )
+
+
 def format_system_prompt(
     model_name: str,
     other_models: list[str],
@@ -376,10 +483,10 @@ def format_system_prompt(
         prompt = SYSTEM_PROMPT_TEMPLATE_V2.format(
             model_name=model_name,
             other_models=", ".join(other_models),
-            personality_traits="\n".join(f"- {trait}" for trait in profile.personality_traits),
-            strength_areas="\n".join(f"- {area}" for area in profile.strength_areas),
+            personality_traits=_bullet_list(profile.personality_traits),
+            strength_areas=_bullet_list(profile.strength_areas),
             communication_style=profile.communication_style,
-            response_rules="\n".join(f"- {rule}" for rule in profile.response_rules),
+            response_rules=_bullet_list(profile.response_rules),
         )
     else:
         # Fall back to original template
@@ -17,7 +17,7 @@ from codecrew.models.base import ModelClient
 from codecrew.models.types import Message, ModelResponse
 
 from .events import SpeakerDecision
-from .prompts import format_should_speak_prompt
+from .prompts import format_batch_should_speak_prompt, format_should_speak_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +28,23 @@ EVALUATION_TIMEOUT = 15.0  # seconds
 # Default silence threshold - models below this confidence stay silent
 DEFAULT_SILENCE_THRESHOLD = 0.3
 
+# Most "should speak?" calls allowed in flight at once
+MAX_CONCURRENT_EVALUATIONS = 8
+
+# Fallback patterns for recovering JSON from loosely formatted responses
+_CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_SHOULD_SPEAK_OBJECT_PATTERN = re.compile(r"\{[^{}]*\"should_speak\"[^{}]*\}", re.DOTALL)
+_PYTHON_TRUE_PATTERN = re.compile(r"\bTrue\b")
+_PYTHON_FALSE_PATTERN = re.compile(r"\bFalse\b")
+
 
 class SpeakingEvaluator:
     """Evaluates which models should speak in the conversation.
 
     Uses parallel API calls to minimize latency, with timeout handling
-    and graceful degradation when models fail to respond.
+    and graceful degradation when models fail to respond. When a router model
+    is set, a single call to it decides for every model, falling back to
+    per-model evaluation if that call fails.
     """
 
     def __init__(
@@ -41,6 +52,8 @@ class SpeakingEvaluator:
         clients: dict[str, ModelClient],
         silence_threshold: float = DEFAULT_SILENCE_THRESHOLD,
         timeout: float = EVALUATION_TIMEOUT,
+        router: Optional[str] = None,
+        max_concurrent: int = MAX_CONCURRENT_EVALUATIONS,
     ):
         """Initialize the speaking evaluator.
 
@@ -48,10 +61,14 @@ class SpeakingEvaluator:
             clients: Dictionary mapping model names to client instances
             silence_threshold: Minimum confidence to speak (0-1)
             timeout: Timeout in seconds for each evaluation
+            router: Optional model name that decides for all models in one call
+            max_concurrent: Most model calls to run at once during evaluation
         """
         self.clients = clients
         self.silence_threshold = silence_threshold
         self.timeout = timeout
+        self.router = router
+        self._semaphore = asyncio.Semaphore(max_concurrent)
 
     async def evaluate_all(
         self,
@@ -73,43 +90,48 @@ class SpeakingEvaluator:
         """
         forced = set(forced_speakers or [])
 
-        # Build evaluation tasks for all models
-        tasks = []
-        model_names = list(self.clients.keys())
-
-        for model_name, client in self.clients.items():
-            if not client.is_available:
-                logger.debug(f"Skipping {model_name} - not available")
-                continue
-
-            # Check if forced to speak
-            is_forced = model_name in forced
+        # Every probe sees the same history, so format it once
+        history = self._format_conversation(conversation)
 
-            # Create evaluation task
-            task = self._evaluate_single(
-                model_name=model_name,
-                client=client,
-                conversation=conversation,
+        if self.router is not None:
+            batched = await self._evaluate_batch(
+                history=history,
                 user_message=user_message,
                 previous_responses=previous_responses,
-                other_models=[m for m in model_names if m != model_name],
-                is_forced=is_forced,
+                forced=forced,
             )
-            tasks.append(task)
+            if batched is not None:
+                batched.sort(key=lambda d: (-d.confidence, d.model))
+                return batched
+
+        model_names = list(self.clients.keys())
 
-        # Run all evaluations in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Run all evaluations in parallel. _evaluate_single turns failures into
+        # default decisions, so one model's error never cancels the others.
+        tasks = []
+        async with asyncio.TaskGroup() as tg:
+            for model_name, client in self.clients.items():
+                if not client.is_available:
+                    logger.debug(f"Skipping {model_name} - not available")
+                    continue
+
+                task = tg.create_task(
+                    self._evaluate_single(
+                        model_name=model_name,
+                        client=client,
+                        history=history,
+                        user_message=user_message,
+                        previous_responses=previous_responses,
+                        other_models=[m for m in model_names if m != model_name],
+                        is_forced=model_name in forced,
+                    )
+                )
+                tasks.append(task)
 
-        # Process results, handling exceptions
-        decisions = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Evaluation failed: {result}")
-            elif result is not None:
-                decisions.append(result)
+        decisions = [task.result() for task in tasks]
 
-        # Sort by confidence descending
-        decisions.sort(key=lambda d: d.confidence, reverse=True)
+        # Sort by confidence descending, ties by model name so event order is stable
+        decisions.sort(key=lambda d: (-d.confidence, d.model))
 
         return decisions
 
@@ -117,7 +139,7 @@ class SpeakingEvaluator:
         self,
         model_name: str,
         client: ModelClient,
-        conversation: list[Message],
+        history: str,
         user_message: str,
         previous_responses: Optional[list[tuple[str, str]]],
         other_models: list[str],
@@ -128,7 +150,7 @@ class SpeakingEvaluator:
         Args:
             model_name: Name of the model
             client: Model client instance
-            conversation: Conversation history
+            history: Conversation history, already formatted for the prompt
             user_message: Latest user message
             previous_responses: Earlier responses this turn
             other_models: Names of other models
@@ -142,9 +164,6 @@ class SpeakingEvaluator:
             return SpeakerDecision.forced(model_name)
 
         try:
-            # Format conversation history for prompt
-            history = self._format_conversation(conversation)
-
             # Build the evaluation prompt
             prompt = format_should_speak_prompt(
                 model_name=client.display_name,
@@ -154,30 +173,23 @@ class SpeakingEvaluator:
                 previous_responses=previous_responses,
             )
 
-            # Query the model with timeout
+            # Query the model with timeout, once a concurrency slot is free
             messages = [Message.user(prompt)]
 
-            response = await asyncio.wait_for(
-                client.generate(
-                    messages=messages,
-                    max_tokens=150,  # Short response expected
-                    temperature=0.3,  # Lower temperature for more consistent decisions
-                ),
-                timeout=self.timeout,
-            )
+            async with self._semaphore:
+                response = await asyncio.wait_for(
+                    client.generate(
+                        messages=messages,
+                        max_tokens=150,  # Short response expected
+                        temperature=0.3,  # Lower temperature for more consistent decisions
+                    ),
+                    timeout=self.timeout,
+                )
 
             # Parse the response
             decision = self._parse_response(model_name, response)
 
-            # Apply silence threshold
-            if decision.confidence < self.silence_threshold:
-                return SpeakerDecision.silent(
-                    model=model_name,
-                    confidence=decision.confidence,
-                    reason=f"Below threshold ({decision.confidence:.2f} < {self.silence_threshold})",
-                )
-
-            return decision
+            return self._apply_threshold(decision)
 
         except asyncio.TimeoutError:
             logger.warning(f"{model_name} evaluation timed out")
@@ -197,6 +209,91 @@ class SpeakingEvaluator:
                 reason=f"Evaluation error - defaulting to speak",
             )
 
+    async def _evaluate_batch(
+        self,
+        history: str,
+        user_message: str,
+        previous_responses: Optional[list[tuple[str, str]]],
+        forced: set[str],
+    ) -> Optional[list[SpeakerDecision]]:
+        """Ask the router model to decide for every available model at once.
+
+        Args:
+            history: Conversation history, already formatted for the prompt
+            user_message: Latest user message
+            previous_responses: Earlier responses this turn
+            forced: Models forced to speak via @mention
+
+        Returns:
+            One SpeakerDecision per available model, or None if the router is
+            unavailable or its answer does not cover every model
+        """
+        if self.router is None:
+            return None
+        router = self.clients.get(self.router)
+        if router is None or not router.is_available:
+            return None
+
+        available = [name for name, client in self.clients.items() if client.is_available]
+        decisions = [SpeakerDecision.forced(name) for name in available if name in forced]
+        to_evaluate = [name for name in available if name not in forced]
+        if not to_evaluate:
+            return decisions
+
+        prompt = format_batch_should_speak_prompt(
+            model_names=to_evaluate,
+            conversation_history=history,
+            user_message=user_message,
+            previous_responses=previous_responses,
+        )
+
+        try:
+            response = await asyncio.wait_for(
+                router.generate(
+                    messages=[Message.user(prompt)],
+                    max_tokens=100 * len(to_evaluate) + 50,
+                    temperature=0.3,
+                ),
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Batched evaluation by %s timed out", self.router)
+            return None
+        except Exception as e:
+            logger.error("Batched evaluation by %s failed: %s", self.router, e)
+            return None
+
+        json_data = self._extract_json(response.content.strip())
+        if not isinstance(json_data, dict):
+            logger.warning("%s returned an unparseable batched decision", self.router)
+            return None
+
+        for name in to_evaluate:
+            entry = json_data.get(name)
+            if not isinstance(entry, dict):
+                logger.warning("Batched decision from %s is missing %s", self.router, name)
+                return None
+            try:
+                decision = self._decision_from_json(name, entry)
+            except (TypeError, ValueError) as e:
+                logger.warning(
+                    "Batched decision from %s for %s is invalid: %s", self.router, name, e
+                )
+                return None
+            decisions.append(self._apply_threshold(decision))
+
+        return decisions
+
+    def _apply_threshold(self, decision: SpeakerDecision) -> SpeakerDecision:
+        """Turn a decision below the silence threshold into a silent one."""
+        if decision.confidence < self.silence_threshold:
+            return SpeakerDecision.silent(
+                model=decision.model,
+                confidence=decision.confidence,
+                reason=f"Below threshold ({decision.confidence:.2f} < {self.silence_threshold})",
+            )
+        return decision
+
     def _parse_response(
         self,
         model_name: str,
@@ -230,6 +327,22 @@ class SpeakingEvaluator:
                 reason="Could not parse response - defaulting to speak",
             )
 
+        return self._decision_from_json(model_name, json_data)
+
+    def _decision_from_json(
+        self,
+        model_name: str,
+        json_data: dict[str, Any],
+    ) -> SpeakerDecision:
+        """Build a SpeakerDecision from a parsed should-speak object.
+
+        Args:
+            model_name: Name of the model
+            json_data: Parsed JSON object with should_speak/confidence/reason
+
+        Returns:
+            SpeakerDecision for this model
+        """
         # Extract fields with defaults
         should_speak = json_data.get("should_speak", True)
         confidence = float(json_data.get("confidence", 0.5))
@@ -262,15 +375,19 @@ class SpeakingEvaluator:
         Returns:
             Parsed JSON dict or None if parsing fails
         """
-        # Try direct JSON parsing first
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            pass
+        # Try the outermost braces first. They cover a bare object as well as
+        # one wrapped in prose or a code fence, so the common shapes parse on
+        # the first attempt without raising or a regex scan
+        start = content.find("{")
+        end = content.rfind("}") + 1
+        if 0 <= start < end:
+            try:
+                return json.loads(content[start:end])
+            except json.JSONDecodeError:
+                pass
 
         # Try extracting from markdown code block
-        code_block_pattern = r"```(?:json)?\s*(\{.*?\})\s*```"
-        match = re.search(code_block_pattern, content, re.DOTALL)
+        match = _CODE_BLOCK_PATTERN.search(content)
         if match:
             try:
                 return json.loads(match.group(1))
@@ -278,8 +395,7 @@ class SpeakingEvaluator:
                 pass
 
         # Try finding JSON object anywhere in content
-        json_pattern = r"\{[^{}]*\"should_speak\"[^{}]*\}"
-        match = re.search(json_pattern, content, re.DOTALL)
+        match = _SHOULD_SPEAK_OBJECT_PATTERN.search(content)
         if match:
             try:
                 return json.loads(match.group(0))
@@ -295,8 +411,8 @@ class SpeakingEvaluator:
             pass
 
         # Handle true/false without quotes
-        fixed = re.sub(r"\bTrue\b", "true", content)
-        fixed = re.sub(r"\bFalse\b", "false", fixed)
+        fixed = _PYTHON_TRUE_PATTERN.sub("true", content)
+        fixed = _PYTHON_FALSE_PATTERN.sub("false", fixed)
         try:
             return json.loads(fixed)
         except json.JSONDecodeError:
@@ -20,9 +20,8 @@ from codecrew.models.types import (
     ToolResult,
     Usage,
 )
-from codecrew.tools.context import ToolContext
 
-from .engine import Orchestrator
+from .engine import Orchestrator, _ChunkCoalescer
 from .events import EventType, OrchestratorEvent
 
 if TYPE_CHECKING:
@@ -83,6 +82,9 @@ class ToolEnabledOrchestrator(Orchestrator):
             enable_parallel_tools: If True, execute parallel-safe tools concurrently.
             **kwargs: Additional args passed to base Orchestrator.
         """
+        # Deferred so importing the orchestrator does not load every builtin tool
+        from codecrew.tools.context import ToolContext
+
         super().__init__(clients=clients, settings=settings, **kwargs)
         self.tool_executor = tool_executor
         self.tool_registry = tool_registry
@@ -122,6 +124,7 @@ class ToolEnabledOrchestrator(Orchestrator):
             tool_calls: list[ToolCall] = []
             finish_reason = FinishReason.STOP
             usage: Optional[Usage] = None
+            coalescer = _ChunkCoalescer()
 
             async for chunk in client.generate_stream(
                 messages=messages,
@@ -130,9 +133,14 @@ class ToolEnabledOrchestrator(Orchestrator):
             ):
                 if chunk.content:
                     content_buffer += chunk.content
-                    yield OrchestratorEvent.response_chunk(model_name, chunk.content)
+                    merged = coalescer.add(chunk.content)
+                    if merged:
+                        yield OrchestratorEvent.response_chunk(model_name, merged)
 
                 if chunk.tool_call:
+                    pending = coalescer.flush()
+                    if pending:
+                        yield OrchestratorEvent.response_chunk(model_name, pending)
                     tool_calls.append(chunk.tool_call)
                     yield OrchestratorEvent.tool_call_event(model_name, chunk.tool_call)
 
@@ -140,6 +148,10 @@ class ToolEnabledOrchestrator(Orchestrator):
                     finish_reason = chunk.finish_reason or FinishReason.STOP
                     usage = chunk.usage
 
+            pending = coalescer.flush()
+            if pending:
+                yield OrchestratorEvent.response_chunk(model_name, pending)
+
             # Build response
             response = ModelResponse(
                 content=content_buffer,
@@ -6,6 +6,7 @@ Handles:
 - Different ordering strategies (rotate, confidence, fixed)
 """
 
+from itertools import chain, islice
 from typing import Literal, Optional
 
 from .events import SpeakerDecision
@@ -67,48 +68,42 @@ class TurnManager:
 
         elif self.strategy == "rotate":
             # Start with current first responder, maintain relative fixed order
-            first = self.current_first_responder
-            ordered = self._order_from_start(speakers, first)
+            start_idx = self._rotation_index % len(self.fixed_order)
+            ordered = self._order_from_start(set(speakers), start_idx)
             self.rotate_first_responder()
             return ordered
 
         else:  # fixed
             # Use fixed order for all speakers
-            return [m for m in self.fixed_order if m in speakers]
+            speaker_set = set(speakers)
+            return [m for m in self.fixed_order if m in speaker_set]
 
     def _order_from_start(
         self,
-        speakers: list[str],
-        first: str,
+        speakers: set[str],
+        start_idx: int,
     ) -> list[str]:
-        """Order speakers starting from a specific model.
+        """Order speakers starting from a position in fixed_order.
 
         Maintains the relative order from fixed_order but starts
-        with the specified model.
+        with the model at start_idx.
 
         Args:
             speakers: Models that will speak
-            first: Model to start with
+            start_idx: Index in fixed_order of the model to start with
 
         Returns:
             Reordered list of speakers
         """
-        # Build order starting from 'first' in fixed_order
-        speaker_set = set(speakers)
-
-        # Find start index in fixed_order
-        try:
-            start_idx = self.fixed_order.index(first)
-        except ValueError:
-            start_idx = 0
-
-        # Build rotated order
-        rotated_fixed = (
-            self.fixed_order[start_idx:] + self.fixed_order[:start_idx]
+        # Walk fixed_order from the start index and wrap around, without
+        # building two slices and their concatenation
+        rotated_fixed = chain(
+            islice(self.fixed_order, start_idx, None),
+            islice(self.fixed_order, start_idx),
         )
 
         # Filter to only include speakers
-        return [m for m in rotated_fixed if m in speaker_set]
+        return [m for m in rotated_fixed if m in speakers]
 
     def get_first_responder(self) -> str:
         """Get the current first responder without rotating.
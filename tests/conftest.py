@@ -1,11 +1,13 @@
 """Pytest configuration and fixtures for CodeCrew tests."""
 
 import asyncio
+import itertools
 import os
 import tempfile
 from pathlib import Path
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Callable, Generator
 
+import aiosqlite
 import pytest
 import pytest_asyncio
 
@@ -13,12 +15,18 @@ from codecrew.config import Settings, reset_settings
 from codecrew.conversation import DatabaseManager
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def pytest_configure(config: pytest.Config) -> None:
+    """Run async tests on uvloop when it is installed.
+
+    pytest-asyncio builds its session loop from the global event loop policy, so
+    installing uvloop's policy here swaps the loop without parametrizing tests.
+    uvloop is unavailable on Windows, where the stdlib loop is used instead.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 @pytest.fixture
@@ -74,13 +82,38 @@ def test_settings(temp_dir: Path) -> Settings:
     )
 
 
+@pytest_asyncio.fixture(scope="session")
+async def migrated_db_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one fully migrated database file for the session to copy."""
+    template_path = tmp_path_factory.mktemp("db_template") / "template.db"
+    await DatabaseManager(template_path).initialize()
+    return template_path
+
+
 @pytest_asyncio.fixture
-async def db_manager(temp_dir: Path) -> AsyncGenerator[DatabaseManager, None]:
-    """Create an initialized database manager for tests."""
-    db_path = temp_dir / "test.db"
-    db = DatabaseManager(db_path)
-    await db.initialize()
-    yield db
+async def db_manager(migrated_db_template: Path) -> AsyncGenerator[DatabaseManager, None]:
+    """Create an initialized in-memory database manager for tests.
+
+    The schema is copied from the session's migrated template with SQLite's
+    backup API rather than migrating each database, and the database lives
+    on the manager's persistent connection, so tests never touch the disk.
+    """
+    db = DatabaseManager(":memory:")
+    async with db:
+        async with db.connect() as conn, aiosqlite.connect(migrated_db_template) as template:
+            await template.backup(conn)
+        yield db
+
+
+@pytest.fixture
+def fake_uuid() -> Callable[[], str]:
+    """Return a generator of unique, deterministic IDs for database rows.
+
+    Cheaper than uuid4 and reproducible, so a failing test reports the same IDs
+    on every run.
+    """
+    counter = itertools.count()
+    return lambda: f"test-uuid-{next(counter)}"
 
 
 @pytest.fixture
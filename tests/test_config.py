@@ -56,6 +56,15 @@ class TestExpandEnvVars:
         assert result[1] == "static"
         del os.environ["LIST_VAR"]
 
+    def test_expand_embedded_vars(self) -> None:
+        """Test expanding several variables embedded in one string."""
+        os.environ["EMBED_HOST"] = "localhost"
+        os.environ["EMBED_PORT"] = "8080"
+        result = _expand_env_vars("http://${EMBED_HOST}:${EMBED_PORT}/${EMBED_MISSING}")
+        assert result == "http://localhost:8080/"
+        del os.environ["EMBED_HOST"]
+        del os.environ["EMBED_PORT"]
+
 
 class TestDeepMerge:
     """Tests for deep dictionary merging."""
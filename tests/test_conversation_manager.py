@@ -2,6 +2,7 @@
 
 import uuid
 from pathlib import Path
+from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
@@ -14,13 +15,25 @@ from codecrew.conversation import (
 from codecrew.models.types import Message, MessageRole, ToolCall, Usage
 
 
-@pytest_asyncio.fixture
-async def conversation_manager(temp_dir: Path) -> ConversationManager:
-    """Create a ConversationManager for tests."""
-    db_path = temp_dir / "test_manager.db"
-    db = DatabaseManager(db_path)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_db(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> AsyncGenerator[DatabaseManager, None]:
+    """Create one migrated database with a persistent connection for the session."""
+    db = DatabaseManager(tmp_path_factory.mktemp("conversation") / "test_manager.db")
     await db.initialize()
-    return ConversationManager(db=db)
+    async with db:
+        yield db
+
+
+@pytest_asyncio.fixture
+async def conversation_manager(
+    shared_db: DatabaseManager,
+) -> AsyncGenerator[ConversationManager, None]:
+    """Create a ConversationManager for tests, wiping its data afterwards."""
+    yield ConversationManager(db=shared_db)
+    # Deleting sessions cascades to messages, tool calls, pins and summaries
+    await shared_db.execute("DELETE FROM sessions")
 
 
 class TestSessionLifecycle:
@@ -236,6 +249,30 @@ class TestMessagePersistence:
 
         saved = await conversation_manager.get_conversation_messages()
         assert len(saved) == 3
+        assert [m.content for m in saved] == ["Message 1", "Response 1", "Message 2"]
+
+    @pytest.mark.asyncio
+    async def test_batch_persist_tool_calls_and_usage(
+        self, conversation_manager: ConversationManager
+    ) -> None:
+        """Test that batch persistence keeps tool calls and per-message usage."""
+        await conversation_manager.create_session(name="Batch Tools Test")
+
+        response = Message.assistant("Reading", model="claude")
+        response.tool_calls.append(
+            ToolCall(id="call_1", name="read_file", arguments={"path": "a.txt"})
+        )
+        usage = Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+
+        message_ids = await conversation_manager.persist_messages(
+            [Message.user("Read a.txt"), response], usages=[None, usage]
+        )
+
+        assert conversation_manager.get_message_id(response) == message_ids[1]
+        saved = await conversation_manager.get_message(message_ids[1])
+        assert saved.tokens_used == 15
+        tool_calls = await conversation_manager.db.get_message_tool_calls(message_ids[1])
+        assert [tc["tool_name"] for tc in tool_calls] == ["read_file"]
 
 
 class TestPinOperations:
@@ -431,6 +468,36 @@ class TestExportImport:
         assert len(messages) == 1
         assert messages[0].content == "Original message"
 
+    @pytest.mark.asyncio
+    async def test_import_json_round_trip(
+        self, conversation_manager: ConversationManager
+    ) -> None:
+        """Test that import preserves order, tool calls and pins."""
+        await conversation_manager.create_session(name="Round Trip")
+        for i in range(5):
+            await conversation_manager.persist_message(Message.user(f"Message {i}"))
+        tool_msg_id = await conversation_manager.persist_message(
+            Message(
+                role=MessageRole.ASSISTANT,
+                content="Reading",
+                model="claude",
+                tool_calls=[ToolCall(id="tc-1", name="read_file", arguments={"path": "a.py"})],
+            )
+        )
+        await conversation_manager.pin_message(tool_msg_id)
+        json_export = await conversation_manager.export_session(format="json")
+
+        new_manager = ConversationManager(db=conversation_manager.db)
+        imported = await new_manager.import_session(json_export)
+
+        assert [m.content for m in imported.messages] == [
+            *(f"Message {i}" for i in range(5)),
+            "Reading",
+        ]
+        assert imported.messages[-1].tool_calls[0].tool_name == "read_file"
+        assert imported.messages[-1].tool_calls[0].parameters == {"path": "a.py"}
+        assert new_manager.pinned_ids == {imported.messages[-1].id}
+
 
 class TestCallbacks:
     """Tests for callback functionality."""
@@ -453,6 +520,21 @@ class TestCallbacks:
 
         assert msg_id in persisted_ids
 
+    @pytest.mark.asyncio
+    async def test_multiple_persisted_callbacks(
+        self, conversation_manager: ConversationManager
+    ) -> None:
+        """Test that every registered callback is called in order."""
+        await conversation_manager.create_session(name="Callbacks Test")
+
+        calls: list[tuple[str, str]] = []
+        conversation_manager.on_message_persisted(lambda mid: calls.append(("first", mid)))
+        conversation_manager.on_message_persisted(lambda mid: calls.append(("second", mid)))
+
+        msg_id = await conversation_manager.persist_message(Message.user("Test"))
+
+        assert calls == [("first", msg_id), ("second", msg_id)]
+
 
 class TestFactoryFunction:
     """Tests for the factory function."""
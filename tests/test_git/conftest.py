@@ -0,0 +1,41 @@
+"""Pytest fixtures for Git integration tests."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def mock_git(mocker: MockerFixture) -> MagicMock:
+    """Replace run_git_command as used by GitRepository with a mock.
+
+    Set ``return_value`` or ``side_effect`` on the returned mock to script
+    the git output seen by the repository.
+    """
+    return mocker.patch("codecrew.git.repository.run_git_command", autospec=True)
+
+
+@pytest.fixture
+def mock_subprocess_run(mocker: MockerFixture) -> MagicMock:
+    """Replace subprocess.run as used by run_git_command with a mock."""
+    return mocker.patch("codecrew.git.utils.subprocess.run", autospec=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Create a directory that looks like a git repository root."""
+    (tmp_path / ".git").mkdir()
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def git_repo_ro(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a git repository root shared by a module's read-only tests.
+
+    Tests using this fixture must not modify the directory.
+    """
+    root = tmp_path_factory.mktemp("repo")
+    (root / ".git").mkdir()
+    return root
@@ -2,7 +2,6 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 import subprocess
 
 from codecrew.git.utils import (
@@ -15,6 +14,11 @@ from codecrew.git.utils import (
     format_diff_stat,
 )
 
+DIFF_STAT_OUTPUT = """ file1.py | 10 +++++++---
+ file2.py | 5 +++++
+ 2 files changed, 12 insertions(+), 3 deletions(-)
+"""
+
 
 class TestGitError:
     """Tests for GitError exception."""
@@ -36,21 +40,32 @@ class TestGitError:
         assert error.stderr == "fatal error"
 
 
-class TestFindGitRoot:
-    """Tests for find_git_root function."""
+@pytest.fixture(scope="module")
+def git_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a read-only tree with a .git directory repo and a .git file repo."""
+    root = tmp_path_factory.mktemp("git_tree")
+    (root / "dir_repo" / ".git").mkdir(parents=True)
+    (root / "dir_repo" / "src" / "lib").mkdir(parents=True)
+    (root / "file_repo").mkdir()
+    # .git as file (submodule or worktree)
+    (root / "file_repo" / ".git").write_text("gitdir: /path/to/actual/git")
+    return root
 
-    def test_find_git_root_exists(self, tmp_path):
-        """Test finding git root when .git exists."""
-        # Create .git directory
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
 
-        # Create subdirectory
-        subdir = tmp_path / "src" / "lib"
-        subdir.mkdir(parents=True)
+class TestFindGitRoot:
+    """Tests for find_git_root function."""
 
-        result = find_git_root(subdir)
-        assert result == tmp_path
+    @pytest.mark.parametrize(
+        "start,expected",
+        [
+            pytest.param("dir_repo/src/lib", "dir_repo", id="from_subdir"),
+            pytest.param("dir_repo", "dir_repo", id="from_root"),
+            pytest.param("file_repo", "file_repo", id="git_file"),
+        ],
+    )
+    def test_find_git_root(self, git_tree, start, expected):
+        """Test finding git root from within a repository."""
+        assert find_git_root(git_tree / start) == git_tree / expected
 
     def test_find_git_root_not_found(self, tmp_path):
         """Test finding git root when not in repo."""
@@ -63,32 +78,13 @@ class TestFindGitRoot:
         # Result could be None or a parent repo - either is valid for this test
         # The key is that the function runs without error
 
-    def test_find_git_root_from_root(self, tmp_path):
-        """Test finding git root when starting at root."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-
-        result = find_git_root(tmp_path)
-        assert result == tmp_path
-
-    def test_find_git_root_with_file(self, tmp_path):
-        """Test .git as file (submodule or worktree)."""
-        git_file = tmp_path / ".git"
-        git_file.write_text("gitdir: /path/to/actual/git")
-
-        result = find_git_root(tmp_path)
-        assert result == tmp_path
-
 
 class TestIsGitRepository:
     """Tests for is_git_repository function."""
 
-    def test_is_git_repository_true(self, tmp_path):
+    def test_is_git_repository_true(self, git_tree):
         """Test returns True when .git exists."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-
-        assert is_git_repository(tmp_path) is True
+        assert is_git_repository(git_tree / "dir_repo") is True
 
     def test_is_git_repository_false(self, tmp_path):
         """Test is_git_repository with isolated directory."""
@@ -103,29 +99,26 @@ class TestIsGitRepository:
 class TestRunGitCommand:
     """Tests for run_git_command function."""
 
-    @patch("subprocess.run")
-    def test_run_git_command_success(self, mock_run, tmp_path):
+    def test_run_git_command_success(self, mock_subprocess_run, tmp_path):
         """Test successful git command execution."""
-        mock_run.return_value = MagicMock(
-            stdout="output",
-            stderr="",
-            returncode=0,
+        mock_subprocess_run.return_value = subprocess.CompletedProcess(
+            args=["git", "status"], returncode=0, stdout="output", stderr=""
         )
 
         result = run_git_command(["status"], cwd=tmp_path)
         assert result.stdout == "output"
 
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
+        mock_subprocess_run.assert_called_once()
+        call_args = mock_subprocess_run.call_args
         assert call_args[0][0] == ["git", "status"]
 
-    @patch("subprocess.run")
-    def test_run_git_command_error(self, mock_run, tmp_path):
+    def test_run_git_command_error(self, mock_subprocess_run, tmp_path):
         """Test git command with non-zero exit."""
-        mock_run.return_value = MagicMock(
+        mock_subprocess_run.return_value = subprocess.CompletedProcess(
+            args=["git", "status"],
+            returncode=128,
             stdout="",
             stderr="fatal: not a git repository",
-            returncode=128,
         )
 
         with pytest.raises(GitError) as exc_info:
@@ -133,23 +126,22 @@ class TestRunGitCommand:
 
         assert "fatal: not a git repository" in str(exc_info.value)
 
-    @patch("subprocess.run")
-    def test_run_git_command_timeout(self, mock_run, tmp_path):
+    def test_run_git_command_timeout(self, mock_subprocess_run, tmp_path):
         """Test git command timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=30)
+        mock_subprocess_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=30)
 
         with pytest.raises(TimeoutError) as exc_info:
             run_git_command(["status"], cwd=tmp_path, timeout=30)
 
         assert "timed out" in str(exc_info.value).lower()
 
-    @patch("subprocess.run")
-    def test_run_git_command_no_check(self, mock_run, tmp_path):
+    def test_run_git_command_no_check(self, mock_subprocess_run, tmp_path):
         """Test git command with check=False."""
-        mock_run.return_value = MagicMock(
+        mock_subprocess_run.return_value = subprocess.CompletedProcess(
+            args=["git", "status"],
+            returncode=1,
             stdout="",
             stderr="error",
-            returncode=1,
         )
 
         # Should not raise with check=False
@@ -157,79 +149,63 @@ class TestRunGitCommand:
         assert result.returncode == 1
 
 
-class TestParseGitStatus:
-    """Tests for parse_git_status function."""
-
-    def test_parse_clean_status(self):
-        """Test parsing clean repository status."""
-        output = ""
-        result = parse_git_status(output)
+def _status(**categories):
+    """Build a full parse_git_status result, defaulting categories to empty."""
+    keys = ("staged", "modified", "untracked", "deleted", "conflicted")
+    return {key: categories.get(key, []) for key in keys}
 
-        assert result["staged"] == []
-        assert result["modified"] == []
-        assert result["deleted"] == []
-        assert result["untracked"] == []
-        assert result["conflicted"] == []
 
-    def test_parse_staged_files(self):
-        """Test parsing staged files."""
-        output = "A  newfile.py\nM  modified.py\nD  deleted.py\n"
-        result = parse_git_status(output)
-
-        assert ("added", "newfile.py") in result["staged"]
-        assert ("modified", "modified.py") in result["staged"]
-        assert ("deleted", "deleted.py") in result["staged"]
-
-    def test_parse_unstaged_modified(self):
-        """Test parsing unstaged modified files."""
-        output = " M file.py\n"
-        result = parse_git_status(output)
-
-        assert "file.py" in result["modified"]
-
-    def test_parse_unstaged_deleted(self):
-        """Test parsing unstaged deleted files."""
-        output = " D removed.py\n"
-        result = parse_git_status(output)
-
-        assert "removed.py" in result["deleted"]
-
-    def test_parse_untracked(self):
-        """Test parsing untracked files."""
-        output = "?? untracked.py\n?? another.txt\n"
-        result = parse_git_status(output)
-
-        assert "untracked.py" in result["untracked"]
-        assert "another.txt" in result["untracked"]
-
-    def test_parse_conflict(self):
-        """Test parsing merge conflicts."""
-        output = "UU conflict.py\nAA both_added.py\n"
-        result = parse_git_status(output)
-
-        assert "conflict.py" in result["conflicted"]
-        assert "both_added.py" in result["conflicted"]
-
-    def test_parse_renamed(self):
-        """Test parsing renamed files."""
-        output = "R  old.py -> new.py\n"
-        result = parse_git_status(output)
-
-        # Renamed files use the new name after parsing
-        assert ("renamed", "new.py") in result["staged"]
-
-    def test_parse_mixed_status(self):
-        """Test parsing mixed index and worktree changes."""
-        output = "MM both.py\nAM added_modified.py\n"
-        result = parse_git_status(output)
-
-        # MM = staged modification + unstaged modification
-        assert ("modified", "both.py") in result["staged"]
-        assert "both.py" in result["modified"]
+class TestParseGitStatus:
+    """Tests for parse_git_status function."""
 
-        # AM = staged addition + unstaged modification
-        assert ("added", "added_modified.py") in result["staged"]
-        assert "added_modified.py" in result["modified"]
+    @pytest.mark.parametrize(
+        "output,expected",
+        [
+            pytest.param("", _status(), id="clean"),
+            pytest.param(
+                "A  newfile.py\nM  modified.py\nD  deleted.py\n",
+                _status(
+                    staged=[
+                        ("added", "newfile.py"),
+                        ("modified", "modified.py"),
+                        ("deleted", "deleted.py"),
+                    ]
+                ),
+                id="staged",
+            ),
+            pytest.param(" M file.py\n", _status(modified=["file.py"]), id="unstaged_modified"),
+            pytest.param(" D removed.py\n", _status(deleted=["removed.py"]), id="unstaged_deleted"),
+            pytest.param(
+                "?? untracked.py\n?? another.txt\n",
+                _status(untracked=["untracked.py", "another.txt"]),
+                id="untracked",
+            ),
+            pytest.param(
+                "UU conflict.py\nAA both_added.py\n",
+                _status(
+                    staged=[("added", "both_added.py")],
+                    conflicted=["conflict.py", "both_added.py"],
+                ),
+                id="conflict",
+            ),
+            # Renamed files use the new name after parsing
+            pytest.param(
+                "R  old.py -> new.py\n", _status(staged=[("renamed", "new.py")]), id="renamed"
+            ),
+            # MM = staged + unstaged modification, AM = staged addition + unstaged modification
+            pytest.param(
+                "MM both.py\nAM added_modified.py\n",
+                _status(
+                    staged=[("modified", "both.py"), ("added", "added_modified.py")],
+                    modified=["both.py", "added_modified.py"],
+                ),
+                id="mixed",
+            ),
+        ],
+    )
+    def test_parse_git_status(self, output, expected):
+        """Test parsing porcelain status output into categories."""
+        assert parse_git_status(output) == expected
 
 
 class TestParseCommitLine:
@@ -271,11 +247,7 @@ class TestFormatDiffStat:
 
     def test_format_diff_stat(self):
         """Test formatting diff stat."""
-        diff = """ file1.py | 10 +++++++---
- file2.py | 5 +++++
- 2 files changed, 12 insertions(+), 3 deletions(-)
-"""
-        result = format_diff_stat(diff)
+        result = format_diff_stat(DIFF_STAT_OUTPUT)
 
         assert "file1.py" in result["files"]
         assert "file2.py" in result["files"]
@@ -0,0 +1,35 @@
+"""Pytest fixtures for model client tests."""
+
+import pytest
+
+from codecrew.models import ClaudeClient, GeminiClient, GPTClient, GrokClient
+
+
+@pytest.fixture(scope="session")
+def claude_client() -> ClaudeClient:
+    """Create a Claude client shared by tests that do not modify it."""
+    return ClaudeClient(api_key="test")
+
+
+@pytest.fixture(scope="session")
+def gpt_client() -> GPTClient:
+    """Create a GPT client shared by tests that do not modify it."""
+    return GPTClient(api_key="test")
+
+
+@pytest.fixture(scope="session")
+def gemini_client() -> GeminiClient:
+    """Create a Gemini client shared by tests that do not modify it."""
+    return GeminiClient(api_key="test")
+
+
+@pytest.fixture(scope="session")
+def grok_client() -> GrokClient:
+    """Create a Grok client shared by tests that do not modify it."""
+    return GrokClient(api_key="test")
+
+
+@pytest.fixture
+def grok_mock_client() -> GrokClient:
+    """Create a Grok client in mock mode."""
+    return GrokClient(mock_mode=True)
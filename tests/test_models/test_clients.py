@@ -1,7 +1,6 @@
 """Tests for model clients."""
 
-import os
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
 
 import pytest
 
@@ -13,10 +12,9 @@ from codecrew.models import (
     Message,
     ModelResponse,
     get_client,
-    get_enabled_clients,
 )
-from codecrew.models.base import AuthenticationError
-from codecrew.models.types import FinishReason, ShouldSpeakResult
+from codecrew.models.base import ModelClient
+from codecrew.models.types import FinishReason, StreamChunk
 
 
 class TestGetClient:
@@ -57,166 +55,112 @@ class TestGetClient:
         assert client.model_id == "claude-3-opus"
 
 
-class TestClaudeClient:
-    """Tests for ClaudeClient."""
+# Shared conversation messages; conversion only reads them
+_USER_HELLO = Message.user("Hello!")
+_ASSISTANT_HI = Message.assistant("Hi there!")
+_SYS_HELPFUL = Message.system("You are helpful.")
 
-    def test_default_model_id(self) -> None:
-        """Test default model ID."""
-        client = ClaudeClient(api_key="test")
-        assert "claude" in client.model_id.lower()
 
-    def test_is_available_with_key(self) -> None:
-        """Test is_available when API key is set."""
-        client = ClaudeClient(api_key="test-key")
-        assert client.is_available is True
+async def _collect_stream(client: ModelClient, messages: list[Message]) -> list[StreamChunk]:
+    """Collect every chunk streamed by a client."""
+    return [chunk async for chunk in client.generate_stream(messages)]
 
-    def test_is_available_without_key(self) -> None:
-        """Test is_available when API key is not set."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Remove any existing key from environment
-            os.environ.pop("ANTHROPIC_API_KEY", None)
-            client = ClaudeClient(api_key=None)
-            assert client.is_available is False
 
-    def test_display_name_and_color(self) -> None:
-        """Test display name and color attributes."""
-        client = ClaudeClient(api_key="test")
-        assert client.display_name == "Claude"
-        assert client.color == "#E07B53"
+# (client fixture, model id substring, display name, color) per provider
+PROVIDERS = [
+    pytest.param(("claude_client", "claude", "Claude", "#E07B53"), id="claude"),
+    pytest.param(("gpt_client", "gpt", "GPT", "#10A37F"), id="gpt"),
+    pytest.param(("gemini_client", "gemini", "Gemini", "#4285F4"), id="gemini"),
+    pytest.param(("grok_client", "grok", "Grok", "#7C3AED"), id="grok"),
+]
+
+
+@pytest.fixture(params=PROVIDERS)
+def provider(request: pytest.FixtureRequest) -> tuple[ModelClient, str, str, str]:
+    """Return each shared provider client with its expected attributes."""
+    fixture, *expected = request.param
+    return (request.getfixturevalue(fixture), *expected)
 
 
-class TestGPTClient:
-    """Tests for GPTClient."""
+class TestProviderClients:
+    """Tests shared by every provider client."""
 
-    def test_default_model_id(self) -> None:
+    def test_default_model_id(self, provider: tuple[ModelClient, str, str, str]) -> None:
         """Test default model ID."""
-        client = GPTClient(api_key="test")
-        assert "gpt" in client.model_id.lower()
+        client, name, _, _ = provider
+        assert name in client.model_id.lower()
 
-    def test_is_available_with_key(self) -> None:
+    def test_is_available_with_key(self, provider: tuple[ModelClient, str, str, str]) -> None:
         """Test is_available when API key is set."""
-        client = GPTClient(api_key="test-key")
+        client, _, _, _ = provider
         assert client.is_available is True
 
-    def test_display_name_and_color(self) -> None:
+    def test_display_name_and_color(self, provider: tuple[ModelClient, str, str, str]) -> None:
         """Test display name and color attributes."""
-        client = GPTClient(api_key="test")
-        assert client.display_name == "GPT"
-        assert client.color == "#10A37F"
+        client, _, display_name, color = provider
+        assert client.display_name == display_name
+        assert client.color == color
 
+    def test_estimate_tokens(self, provider: tuple[ModelClient, str, str, str]) -> None:
+        """Test token estimation."""
+        client, _, _, _ = provider
+        count = client.count_tokens("Hello, world!")
+        assert count > 0
+        assert count < 100  # Reasonable range
 
-class TestGeminiClient:
-    """Tests for GeminiClient."""
+    def test_count_tokens_batch_matches_loop(
+        self, provider: tuple[ModelClient, str, str, str]
+    ) -> None:
+        """Test batch token counting agrees with counting each text."""
+        client, _, _, _ = provider
+        if client.name == "gemini":
+            pytest.skip("Gemini counts tokens through the API")
+        texts = ["Hello, world!", "", "def main():\n    return 42\n" * 10]
+        assert client.count_tokens_batch(texts) == [client.count_tokens(t) for t in texts]
 
-    def test_default_model_id(self) -> None:
-        """Test default model ID."""
-        client = GeminiClient(api_key="test")
-        assert "gemini" in client.model_id.lower()
 
-    def test_is_available_with_key(self) -> None:
-        """Test is_available when API key is set."""
-        client = GeminiClient(api_key="test-key")
-        assert client.is_available is True
+class TestClaudeClient:
+    """Tests for ClaudeClient."""
 
-    def test_display_name_and_color(self) -> None:
-        """Test display name and color attributes."""
-        client = GeminiClient(api_key="test")
-        assert client.display_name == "Gemini"
-        assert client.color == "#4285F4"
+    def test_is_available_without_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test is_available when API key is not set."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        client = ClaudeClient(api_key=None)
+        assert client.is_available is False
 
 
 class TestGrokClient:
     """Tests for GrokClient."""
 
-    def test_default_model_id(self) -> None:
-        """Test default model ID."""
-        client = GrokClient(api_key="test")
-        assert "grok" in client.model_id.lower()
-
-    def test_is_available_with_key(self) -> None:
-        """Test is_available when API key is set."""
-        client = GrokClient(api_key="test-key")
-        assert client.is_available is True
-
     def test_is_available_in_mock_mode(self) -> None:
         """Test is_available in mock mode."""
         client = GrokClient(mock_mode=True)
         assert client.is_available is True
 
-    def test_display_name_and_color(self) -> None:
-        """Test display name and color attributes."""
-        client = GrokClient(api_key="test")
-        assert client.display_name == "Grok"
-        assert client.color == "#7C3AED"
-
     @pytest.mark.asyncio
-    async def test_mock_generate(self) -> None:
-        """Test mock generation."""
-        client = GrokClient(mock_mode=True)
-        messages = [Message.user("Hello, Grok!")]
-
-        response = await client.generate(messages)
+    async def test_mock_generate_and_stream(self, grok_mock_client: GrokClient) -> None:
+        """Test mock generation and streaming."""
+        response, chunks = await asyncio.gather(
+            grok_mock_client.generate([Message.user("Hello, Grok!")]),
+            _collect_stream(grok_mock_client, [Message.user("Hello!")]),
+        )
 
         assert isinstance(response, ModelResponse)
         assert response.model == "grok"
         assert response.finish_reason == FinishReason.STOP
         assert len(response.content) > 0
 
-    @pytest.mark.asyncio
-    async def test_mock_stream(self) -> None:
-        """Test mock streaming."""
-        client = GrokClient(mock_mode=True)
-        messages = [Message.user("Hello!")]
-
-        chunks = []
-        async for chunk in client.generate_stream(messages):
-            chunks.append(chunk)
-
         # Should have content chunks and a final complete chunk
         assert len(chunks) > 0
         assert chunks[-1].is_complete is True
 
 
-class TestTokenCounting:
-    """Tests for token counting."""
-
-    def test_claude_estimate_tokens(self) -> None:
-        """Test Claude token estimation."""
-        client = ClaudeClient(api_key="test")
-        count = client.count_tokens("Hello, world!")
-        assert count > 0
-        assert count < 100  # Reasonable range
-
-    def test_gpt_estimate_tokens(self) -> None:
-        """Test GPT token estimation."""
-        client = GPTClient(api_key="test")
-        count = client.count_tokens("Hello, world!")
-        assert count > 0
-        assert count < 100
-
-    def test_gemini_estimate_tokens(self) -> None:
-        """Test Gemini token estimation."""
-        client = GeminiClient(api_key="test")
-        count = client.count_tokens("Hello, world!")
-        assert count > 0
-        assert count < 100
-
-    def test_grok_estimate_tokens(self) -> None:
-        """Test Grok token estimation."""
-        client = GrokClient(api_key="test")
-        count = client.count_tokens("Hello, world!")
-        assert count > 0
-        assert count < 100
-
-
 class TestShouldSpeak:
     """Tests for should_speak functionality."""
 
-    def test_parse_should_speak_response_valid(self) -> None:
+    def test_parse_should_speak_response_valid(self, claude_client: ClaudeClient) -> None:
         """Test parsing valid JSON response."""
-        client = ClaudeClient(api_key="test")
-
-        result = client._parse_should_speak_response(
+        result = claude_client._parse_should_speak_response(
             '{"should_speak": true, "confidence": 0.8, "reason": "I have something to add"}'
         )
 
@@ -224,85 +168,91 @@ class TestShouldSpeak:
         assert result.confidence == 0.8
         assert result.reason == "I have something to add"
 
-    def test_parse_should_speak_response_no(self) -> None:
+    def test_parse_should_speak_response_no(self, claude_client: ClaudeClient) -> None:
         """Test parsing 'no' response."""
-        client = ClaudeClient(api_key="test")
-
-        result = client._parse_should_speak_response(
+        result = claude_client._parse_should_speak_response(
             '{"should_speak": false, "confidence": 0.9, "reason": "Already covered"}'
         )
 
         assert result.should_speak is False
 
-    def test_parse_should_speak_response_markdown(self) -> None:
+    def test_parse_should_speak_response_markdown(self, claude_client: ClaudeClient) -> None:
         """Test parsing response with markdown code blocks."""
-        client = ClaudeClient(api_key="test")
-
-        result = client._parse_should_speak_response(
+        result = claude_client._parse_should_speak_response(
             '```json\n{"should_speak": true, "confidence": 0.7, "reason": "test"}\n```'
         )
 
         assert result.should_speak is True
 
-    def test_parse_should_speak_response_invalid(self) -> None:
-        """Test parsing invalid response defaults to speaking."""
-        client = ClaudeClient(api_key="test")
+    def test_parse_should_speak_response_bare_fence(self, claude_client: ClaudeClient) -> None:
+        """Test parsing response in a code block without a language tag."""
+        result = claude_client._parse_should_speak_response(
+            '```\n{"should_speak": false, "confidence": 0.4, "reason": "bare"}```'
+        )
+
+        assert result.should_speak is False
+        assert result.reason == "bare"
 
-        result = client._parse_should_speak_response("Not valid JSON at all")
+    def test_parse_should_speak_response_invalid(self, claude_client: ClaudeClient) -> None:
+        """Test parsing invalid response defaults to speaking."""
+        result = claude_client._parse_should_speak_response("Not valid JSON at all")
 
         # Should default to speaking when can't parse
         assert result.should_speak is True
         assert result.confidence == 0.5
 
+    def test_parse_should_speak_response_cached(self, claude_client: ClaudeClient) -> None:
+        """Test identical responses share one parsed result."""
+        content = '{"should_speak": true, "confidence": 0.6, "reason": "cached"}'
+
+        first = claude_client._parse_should_speak_response(content)
+        second = claude_client._parse_should_speak_response(content)
+
+        assert first is second
+
 
 class TestMessageConversion:
     """Tests for message format conversion."""
 
-    def test_claude_convert_user_message(self) -> None:
+    def test_claude_convert_user_message(self, claude_client: ClaudeClient) -> None:
         """Test converting user message for Claude."""
-        client = ClaudeClient(api_key="test")
-        messages = [Message.user("Hello!")]
-
-        system, converted = client._convert_messages(messages)
+        system, converted = claude_client._convert_messages([_USER_HELLO])
 
         assert system is None
         assert len(converted) == 1
         assert converted[0]["role"] == "user"
         assert converted[0]["content"] == "Hello!"
 
-    def test_claude_convert_system_message(self) -> None:
-        """Test converting system message for Claude."""
-        client = ClaudeClient(api_key="test")
-        messages = [
-            Message.system("You are helpful."),
-            Message.user("Hello!"),
+    def test_claude_system_blocks_cacheable(self, claude_client: ClaudeClient) -> None:
+        """Test the Claude system prompt is sent as a cacheable text block."""
+        blocks = claude_client._system_blocks("You are helpful.")
+
+        assert blocks == [
+            {
+                "type": "text",
+                "text": "You are helpful.",
+                "cache_control": {"type": "ephemeral"},
+            }
         ]
 
-        system, converted = client._convert_messages(messages)
+    def test_claude_convert_system_message(self, claude_client: ClaudeClient) -> None:
+        """Test converting system message for Claude."""
+        system, converted = claude_client._convert_messages([_SYS_HELPFUL, _USER_HELLO])
 
         assert system == "You are helpful."
         assert len(converted) == 1  # System message not in messages list
 
-    def test_gpt_convert_messages(self) -> None:
+    def test_gpt_convert_messages(self, gpt_client: GPTClient) -> None:
         """Test converting messages for GPT."""
-        client = GPTClient(api_key="test")
-        messages = [
-            Message.user("Hello!"),
-            Message.assistant("Hi there!"),
-        ]
-
-        converted = client._convert_messages(messages)
+        converted = gpt_client._convert_messages([_USER_HELLO, _ASSISTANT_HI])
 
         assert len(converted) == 2
         assert converted[0]["role"] == "user"
         assert converted[1]["role"] == "assistant"
 
-    def test_gpt_convert_with_system(self) -> None:
+    def test_gpt_convert_with_system(self, gpt_client: GPTClient) -> None:
         """Test converting messages with system prompt for GPT."""
-        client = GPTClient(api_key="test")
-        messages = [Message.user("Hello!")]
-
-        converted = client._convert_messages(messages, system="Be helpful.")
+        converted = gpt_client._convert_messages([_USER_HELLO], system="Be helpful.")
 
         assert len(converted) == 2
         assert converted[0]["role"] == "system"
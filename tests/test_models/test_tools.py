@@ -1,9 +1,15 @@
 """Tests for tool definitions."""
 
+from typing import Any, Callable
+
 import pytest
 
 from codecrew.models.tools import (
     DEFAULT_TOOLS,
+    DEFAULT_TOOLS_ANTHROPIC,
+    DEFAULT_TOOLS_GOOGLE,
+    DEFAULT_TOOLS_OPENAI,
+    DEFAULT_TOOLS_XAI,
     ToolDefinition,
     ToolParameter,
     tools_to_anthropic,
@@ -53,6 +59,14 @@ class TestToolParameter:
 
         assert schema["enum"] == ["json", "yaml", "toml"]
 
+    def test_to_json_schema_is_precomputed(self) -> None:
+        """Test that the schema is built once and reused."""
+        param = ToolParameter(name="path", type="string", description="File path")
+
+        assert param.to_json_schema() is param.to_json_schema()
+        with pytest.raises(AttributeError):
+            param.type = "integer"  # type: ignore[misc]
+
 
 class TestToolDefinition:
     """Tests for ToolDefinition class."""
@@ -69,6 +83,34 @@ class TestToolDefinition:
         assert tool.name == "read_file"
         assert len(tool.parameters) == 1
 
+    def test_conversions_are_cached(self) -> None:
+        """Test that repeated conversions reuse the first result."""
+        tool = ToolDefinition(
+            name="read_file",
+            description="Read a file",
+            parameters=[
+                ToolParameter(name="path", type="string", description="File path"),
+            ],
+        )
+        assert tool.to_anthropic() is tool.to_anthropic()
+        assert tool.to_openai() is tool.to_xai()
+        assert tool.to_google()["parameters"] is tool.to_anthropic()["input_schema"]
+
+    def test_tool_is_immutable(self) -> None:
+        """Test that tool definitions cannot be reassigned after creation."""
+        tool = ToolDefinition(name="read_file", description="Read a file")
+        with pytest.raises(AttributeError):
+            tool.name = "write_file"  # type: ignore[misc]
+
+    def test_tool_hashes_by_identity(self) -> None:
+        """Test that tools with list parameters can be used as set members."""
+        param = ToolParameter(name="path", type="string", description="File path")
+        tool = ToolDefinition(name="read_file", description="Read a file", parameters=[param])
+        twin = ToolDefinition(name="read_file", description="Read a file", parameters=[param])
+
+        assert len({tool, twin, tool}) == 2
+        assert tool != twin
+
     def test_to_anthropic(self) -> None:
         """Test converting to Anthropic format."""
         tool = ToolDefinition(
@@ -134,50 +176,35 @@ class TestToolDefinition:
         assert xai == openai
 
 
-class TestToolConversionFunctions:
-    """Tests for batch tool conversion functions."""
-
-    def test_tools_to_anthropic(self) -> None:
-        """Test converting multiple tools to Anthropic format."""
-        tools = [
-            ToolDefinition(name="tool1", description="Tool 1", parameters=[]),
-            ToolDefinition(name="tool2", description="Tool 2", parameters=[]),
-        ]
-        result = tools_to_anthropic(tools)
-
-        assert len(result) == 2
-        assert result[0]["name"] == "tool1"
-        assert result[1]["name"] == "tool2"
-
-    def test_tools_to_openai(self) -> None:
-        """Test converting multiple tools to OpenAI format."""
-        tools = [
-            ToolDefinition(name="tool1", description="Tool 1", parameters=[]),
-        ]
-        result = tools_to_openai(tools)
-
-        assert len(result) == 1
-        assert result[0]["type"] == "function"
-
-    def test_tools_to_google(self) -> None:
-        """Test converting multiple tools to Google format."""
-        tools = [
-            ToolDefinition(name="tool1", description="Tool 1", parameters=[]),
-        ]
-        result = tools_to_google(tools)
-
-        assert len(result) == 1
-        assert result[0]["name"] == "tool1"
-
-    def test_tools_to_xai(self) -> None:
-        """Test converting multiple tools to xAI format."""
-        tools = [
-            ToolDefinition(name="tool1", description="Tool 1", parameters=[]),
-        ]
-        result = tools_to_xai(tools)
+@pytest.fixture(scope="module")
+def sample_tools() -> list[ToolDefinition]:
+    """Create a small list of tools shared by the batch conversion tests."""
+    return [
+        ToolDefinition(name="tool1", description="Tool 1", parameters=[]),
+        ToolDefinition(name="tool2", description="Tool 2", parameters=[]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "fn,key",
+    [
+        (tools_to_anthropic, "name"),
+        (tools_to_openai, "type"),
+        (tools_to_google, "name"),
+        (tools_to_xai, "type"),
+    ],
+    ids=lambda value: getattr(value, "__name__", value),
+)
+def test_batch_conversion(
+    fn: Callable[[list[ToolDefinition]], list[dict[str, Any]]],
+    key: str,
+    sample_tools: list[ToolDefinition],
+) -> None:
+    """Test batch conversion returns one converted dict per tool."""
+    result = fn(sample_tools)
 
-        assert len(result) == 1
-        assert result[0]["type"] == "function"
+    assert len(result) == len(sample_tools)
+    assert key in result[0]
 
 
 class TestDefaultTools:
@@ -206,16 +233,21 @@ class TestDefaultTools:
         assert exec_cmd is not None
         assert "command" in [p.name for p in exec_cmd.parameters]
 
-    def test_all_default_tools_convert(self) -> None:
-        """Test that all default tools can be converted to all formats."""
-        for tool in DEFAULT_TOOLS:
-            # Should not raise
-            anthropic = tool.to_anthropic()
-            openai = tool.to_openai()
-            google = tool.to_google()
-            xai = tool.to_xai()
-
-            assert anthropic["name"] == tool.name
-            assert openai["function"]["name"] == tool.name
-            assert google["name"] == tool.name
-            assert xai["function"]["name"] == tool.name
+    @pytest.mark.parametrize("tool", DEFAULT_TOOLS, ids=lambda t: t.name)
+    @pytest.mark.parametrize("fmt", ["anthropic", "openai", "google", "xai"])
+    def test_default_tool_convert(self, tool: ToolDefinition, fmt: str) -> None:
+        """Test that each default tool converts to each provider format."""
+        # Should not raise
+        converted = getattr(tool, f"to_{fmt}")()
+
+        # OpenAI-compatible formats nest the declaration under "function"
+        declaration = converted["function"] if fmt in ("openai", "xai") else converted
+        assert declaration["name"] == tool.name
+
+    def test_default_tools_use_precomputed_payloads(self) -> None:
+        """Test that converting DEFAULT_TOOLS returns the precomputed lists."""
+        assert tools_to_anthropic(DEFAULT_TOOLS) is DEFAULT_TOOLS_ANTHROPIC
+        assert tools_to_openai(DEFAULT_TOOLS) is DEFAULT_TOOLS_OPENAI
+        assert tools_to_google(DEFAULT_TOOLS) is DEFAULT_TOOLS_GOOGLE
+        assert tools_to_xai(DEFAULT_TOOLS) is DEFAULT_TOOLS_XAI
+        assert DEFAULT_TOOLS_ANTHROPIC == [tool.to_anthropic() for tool in DEFAULT_TOOLS]
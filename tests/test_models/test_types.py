@@ -1,5 +1,8 @@
 """Tests for model types."""
 
+import functools
+import operator
+
 import pytest
 
 from codecrew.models.types import (
@@ -52,21 +55,28 @@ class TestMessage:
         assert len(msg.tool_results) == 1
         assert msg.tool_results[0].tool_call_id == "call_123"
 
-    def test_is_user_message(self) -> None:
-        """Test is_user_message property."""
-        user_msg = Message.user("test")
-        assistant_msg = Message.assistant("test")
-
-        assert user_msg.is_user_message is True
-        assert assistant_msg.is_user_message is False
-
-    def test_is_assistant_message(self) -> None:
-        """Test is_assistant_message property."""
-        user_msg = Message.user("test")
-        assistant_msg = Message.assistant("test")
-
-        assert user_msg.is_assistant_message is False
-        assert assistant_msg.is_assistant_message is True
+    @pytest.mark.parametrize(
+        "msg,is_user,is_assistant",
+        [
+            (Message.user("test"), True, False),
+            (Message.assistant("test"), False, True),
+            (Message.system("test"), False, False),
+        ],
+        ids=["user", "assistant", "system"],
+    )
+    def test_role_predicates(self, msg: Message, is_user: bool, is_assistant: bool) -> None:
+        """Test is_user_message and is_assistant_message."""
+        assert msg.is_user_message is is_user
+        assert msg.is_assistant_message is is_assistant
+
+    def test_stable_id(self) -> None:
+        """Test stable_id depends only on role and content."""
+        msg = Message.user("Hello")
+
+        assert msg.stable_id == Message.user("Hello").stable_id
+        assert msg.stable_id != Message.assistant("Hello").stable_id
+        assert msg.stable_id != Message.user("Hello!").stable_id
+        assert len(msg.stable_id) == 32
 
 
 class TestToolCall:
@@ -140,6 +150,18 @@ class TestUsage:
         combined = usage1 + usage2
         assert combined.cost_estimate == 0.03
 
+    def test_usage_sum_matches_reduce(self) -> None:
+        """Test Usage.sum matches adding usage objects pairwise."""
+        usages = [
+            Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150),
+            Usage(prompt_tokens=200, completion_tokens=100, total_tokens=300, cost_estimate=0.02),
+            Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15, cost_estimate=0.01),
+        ]
+
+        assert Usage.sum(usages) == functools.reduce(operator.add, usages)
+        assert Usage.sum(usages[:1]).cost_estimate is None
+        assert Usage.sum([]) == Usage()
+
 
 class TestModelResponse:
     """Tests for ModelResponse class."""
@@ -217,6 +239,22 @@ class TestStreamChunk:
         assert chunk.tool_call.name == "test"
 
 
+@pytest.mark.parametrize(
+    "instance",
+    [
+        ToolCall(id="call_1", name="read_file", arguments={}),
+        ToolResult(tool_call_id="call_1", content="ok"),
+        Usage(),
+        ModelResponse(content="", model="claude", finish_reason=FinishReason.STOP),
+        StreamChunk(),
+    ],
+    ids=lambda instance: type(instance).__name__,
+)
+def test_types_use_slots(instance: object) -> None:
+    """Test that high-volume types are slotted and carry no instance dict."""
+    assert not hasattr(instance, "__dict__")
+
+
 class TestEstimateCost:
     """Tests for cost estimation."""
 
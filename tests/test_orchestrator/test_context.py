@@ -23,6 +23,9 @@ class MockModelClient:
         # Simple approximation: 1 token per 4 characters
         return len(text) // 4
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        return [self.count_tokens(text) for text in texts]
+
 
 class TestContextAssembler:
     """Tests for ContextAssembler class."""
@@ -76,24 +79,16 @@ class TestContextAssembler:
         assembler = ContextAssembler(max_tokens=200, response_reserve=20)
         model = MockModelClient("claude")
 
-        # Create messages with IDs
         msg1 = Message.user("First message")
         msg2 = Message.user("Important pinned message")
         msg3 = Message.user("Third message")
-
-        # Set IDs manually for testing
-        msg1_id = "msg1"
-        msg2_id = "msg2"
-        msg3_id = "msg3"
-
-        # Use object IDs since Message doesn't have id attribute
         conversation = [msg1, msg2, msg3]
 
         system, messages = assembler.assemble_for_model(
             conversation=conversation,
             model=model,
             other_models=[],
-            pinned_ids={str(id(msg2))},  # Pin the second message
+            pinned_ids={msg2.stable_id},  # Pin the second message
             include_system=False,
         )
 
@@ -116,6 +111,24 @@ class TestContextAssembler:
         assert "Claude" in system
         assert "GPT" in system  # Other model mentioned
 
+    def test_system_prompt_stable_across_model_order(self) -> None:
+        """Test that other-model ordering does not change the system prompt."""
+        assembler = ContextAssembler()
+        model = MockModelClient("claude")
+
+        first, _ = assembler.assemble_for_model(
+            conversation=[Message.user("test")],
+            model=model,
+            other_models=["gpt", "gemini", "grok"],
+        )
+        second, _ = assembler.assemble_for_model(
+            conversation=[Message.user("test"), Message.assistant("reply", model="gpt")],
+            model=model,
+            other_models=["grok", "gpt", "gemini"],
+        )
+
+        assert first == second
+
     def test_no_system_prompt(self) -> None:
         """Test excluding system prompt."""
         assembler = ContextAssembler()
@@ -158,6 +171,55 @@ class TestContextAssembler:
         tokens = assembler.estimate_tokens(messages, model)
         assert tokens > 0
 
+    def test_content_tokens_counted_once(self) -> None:
+        """Test that message content is counted once across assemblies."""
+        assembler = ContextAssembler()
+        model = MockModelClient("claude")
+        counted: list[str] = []
+        count_tokens = model.count_tokens
+        model.count_tokens = lambda text: counted.append(text) or count_tokens(text)
+
+        conversation = [Message.user("Hello world"), Message.assistant("Hi!", model="claude")]
+        first = assembler.estimate_tokens(conversation, model)
+        second = assembler.estimate_tokens(conversation, model)
+
+        assert first == second
+        assert counted.count("Hello world") == 1
+        assert counted.count("Hi!") == 1
+
+    def test_estimate_tokens_counts_in_one_batch(self) -> None:
+        """Test that uncached message contents are counted in a single batch."""
+        assembler = ContextAssembler()
+        model = MockModelClient("claude")
+        batches: list[list[str]] = []
+        count_tokens_batch = model.count_tokens_batch
+        model.count_tokens_batch = lambda texts: batches.append(texts) or count_tokens_batch(texts)
+
+        conversation = [Message.user("Hello world"), Message.user("How are you?")]
+        assembler.estimate_tokens(conversation, model)
+        conversation.append(Message.user("Fine"))
+        assembler.estimate_tokens(conversation, model)
+
+        assert batches == [["Hello world", "How are you?"], ["Fine"]]
+
+    def test_system_prompt_cached(self) -> None:
+        """Test that repeated assemblies reuse the rendered system prompt."""
+        assembler = ContextAssembler()
+        model = MockModelClient("claude")
+        counted: list[str] = []
+        count_tokens = model.count_tokens
+        model.count_tokens = lambda text: counted.append(text) or count_tokens(text)
+
+        first, _ = assembler.assemble_for_model([], model, other_models=["gpt", "grok"])
+        second, _ = assembler.assemble_for_model([], model, other_models=["grok", "gpt"])
+        other, _ = assembler.assemble_for_model(
+            [], model, other_models=["gpt", "grok"], additional_context="Extra"
+        )
+
+        assert first is second
+        assert other != first
+        assert counted.count(first) == 1
+
     def test_would_exceed_limit(self) -> None:
         """Test checking if message would exceed limit."""
         assembler = ContextAssembler(max_tokens=50, response_reserve=10)
@@ -175,6 +237,20 @@ class TestContextAssembler:
 
         assert exceeds is True
 
+    def test_would_exceed_limit_skips_tokenizer_when_clearly_under(self) -> None:
+        """Test that a conversation far under the limit is not tokenized."""
+        assembler = ContextAssembler(max_tokens=10000, response_reserve=100)
+        model = MockModelClient("claude")
+        model.count_tokens = lambda text: pytest.fail("tokenizer should not be called")
+
+        exceeds = assembler.would_exceed_limit(
+            conversation=[Message.user("Hello"), Message.assistant("Hi!", model="gpt")],
+            new_message=Message.user("héllo wörld"),
+            model=model,
+        )
+
+        assert exceeds is False
+
     def test_empty_conversation(self) -> None:
         """Test with empty conversation."""
         assembler = ContextAssembler()
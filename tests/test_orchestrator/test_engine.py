@@ -1,6 +1,8 @@
 """Integration tests for the orchestrator engine."""
 
 import asyncio
+import subprocess
+import sys
 from typing import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock
 
@@ -14,7 +16,8 @@ from codecrew.models.types import (
     StreamChunk,
     Usage,
 )
-from codecrew.orchestrator import Orchestrator, EventType, OrchestratorEvent
+from codecrew.orchestrator import Orchestrator, EventType, OrchestratorEvent, SpeakerDecision
+from codecrew.orchestrator.engine import _ChunkCoalescer
 
 
 class MockModelClient:
@@ -31,10 +34,26 @@ class MockModelClient:
         self.display_name = name.title()
         self.color = "#000000"
         self.model_id = f"{name}-test"
-        self._response_content = response_content
-        self._should_speak_response = should_speak_response
         self._is_available = is_available
         self._call_count = 0
+        # Responses are built once so tests exercise the orchestrator, not the mock
+        usage = Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150)
+        self._should_speak = ModelResponse(
+            content=should_speak_response,
+            model=name,
+            finish_reason=FinishReason.STOP,
+            usage=usage,
+        )
+        self._response = ModelResponse(
+            content=response_content,
+            model=name,
+            finish_reason=FinishReason.STOP,
+            usage=usage,
+        )
+        # One chunk per character, then the completion chunk
+        self._stream_chunks = tuple(StreamChunk(content=char) for char in response_content) + (
+            StreamChunk(is_complete=True, finish_reason=FinishReason.STOP, usage=usage),
+        )
 
     @property
     def is_available(self) -> bool:
@@ -51,16 +70,8 @@ class MockModelClient:
         self._call_count += 1
         # First call is usually should_speak evaluation (short max_tokens)
         if max_tokens and max_tokens <= 150:
-            content = self._should_speak_response
-        else:
-            content = self._response_content
-
-        return ModelResponse(
-            content=content,
-            model=self.name,
-            finish_reason=FinishReason.STOP,
-            usage=Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150),
-        )
+            return self._should_speak
+        return self._response
 
     async def generate_stream(
         self,
@@ -70,15 +81,8 @@ class MockModelClient:
         system=None,
         tools=None,
     ) -> AsyncIterator[StreamChunk]:
-        # Yield content in chunks
-        for char in self._response_content:
-            yield StreamChunk(content=char)
-
-        yield StreamChunk(
-            is_complete=True,
-            finish_reason=FinishReason.STOP,
-            usage=Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150),
-        )
+        for chunk in self._stream_chunks:
+            yield chunk
 
     def count_tokens(self, text: str) -> int:
         return len(text) // 4
@@ -214,8 +218,10 @@ class TestOrchestrator:
         assert len(silent_events) == 2
 
     @pytest.mark.asyncio
-    async def test_streaming_response(self) -> None:
+    async def test_streaming_response(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test streaming response chunks."""
+        # Keep the time budget out of the way so only the size budget flushes
+        monkeypatch.setattr("codecrew.orchestrator.engine.CHUNK_FLUSH_INTERVAL", 3600.0)
         clients = {
             "claude": MockModelClient("claude", response_content="Hello"),
         }
@@ -230,6 +236,9 @@ class TestOrchestrator:
         # Should have response chunks
         chunk_events = [e for e in events if e.type == EventType.RESPONSE_CHUNK]
         assert len(chunk_events) > 0
+        # Per-character chunks are coalesced into fewer events
+        assert len(chunk_events) < len("Hello")
+        assert "".join(e.content for e in chunk_events) == "Hello"
 
     @pytest.mark.asyncio
     async def test_turn_complete_aggregates_usage(self) -> None:
@@ -253,6 +262,27 @@ class TestOrchestrator:
             assert turn_complete.usage.total_tokens > 0
 
 
+class TestChunkCoalescer:
+    """Tests for streamed chunk coalescing."""
+
+    def test_flushes_on_size(self) -> None:
+        """Test that text is held until the size budget is reached."""
+        coalescer = _ChunkCoalescer(flush_size=4, flush_interval=60.0)
+
+        assert coalescer.add("ab") is None
+        assert coalescer.add("cd") == "abcd"
+        assert coalescer.add("e") is None
+        assert coalescer.flush() == "e"
+        assert coalescer.flush() is None
+
+    def test_flushes_on_interval(self) -> None:
+        """Test that a zero interval passes every chunk straight through."""
+        coalescer = _ChunkCoalescer(flush_size=64, flush_interval=0.0)
+
+        assert coalescer.add("a") == "a"
+        assert coalescer.add("b") == "b"
+
+
 class TestOrchestratorState:
     """Tests for orchestrator state management."""
 
@@ -281,6 +311,26 @@ class TestOrchestratorState:
         assert len(orchestrator.conversation) == 0
         assert len(orchestrator.pinned_ids) == 0
 
+    @pytest.mark.parametrize(
+        "batch,router_model,expected",
+        [
+            (False, "gpt", None),
+            (True, None, "claude"),
+            (True, "gpt", "gpt"),
+            (True, "grok", "claude"),  # Unavailable router falls back
+        ],
+    )
+    def test_should_speak_router(self, batch: bool, router_model, expected) -> None:
+        """Test which model, if any, batches the should-speak decisions."""
+        clients = {"claude": MockModelClient("claude"), "gpt": MockModelClient("gpt")}
+        settings = create_test_settings()
+        settings.conversation.batch_should_speak = batch
+        settings.conversation.router_model = router_model
+
+        orchestrator = Orchestrator(clients, settings)
+
+        assert orchestrator.speaking_evaluator.router == expected
+
     def test_pin_unpin_message(self) -> None:
         """Test pinning and unpinning messages."""
         clients = {"claude": MockModelClient("claude")}
@@ -294,6 +344,18 @@ class TestOrchestratorState:
         orchestrator.unpin_message("msg1")
         assert "msg1" not in orchestrator.pinned_ids
 
+    def test_pin_message_by_message(self) -> None:
+        """Test pinning a Message pins its stable ID."""
+        clients = {"claude": MockModelClient("claude")}
+        orchestrator = Orchestrator(clients, create_test_settings())
+        msg = Message.user("Remember this")
+
+        orchestrator.pin_message(msg)
+        assert Message.user("Remember this").stable_id in orchestrator.pinned_ids
+
+        orchestrator.unpin_message(msg)
+        assert msg.stable_id not in orchestrator.pinned_ids
+
     def test_get_model_status(self) -> None:
         """Test getting model status."""
         clients = {
@@ -349,3 +411,33 @@ class TestRetryAndForceSpeak:
         will_speak = [e for e in events if e.type == EventType.WILL_SPEAK]
         assert len(will_speak) == 1
         assert will_speak[0].decision.is_forced is True
+
+
+def test_events_use_slots() -> None:
+    """Test that per-turn event objects are slotted and carry no instance dict."""
+    decision = SpeakerDecision.forced("claude")
+    event = OrchestratorEvent.will_speak(decision)
+
+    assert not hasattr(decision, "__dict__")
+    assert not hasattr(event, "__dict__")
+
+
+def test_no_sdk_imports() -> None:
+    """Test that importing the orchestrator does not load provider SDKs or tools.
+
+    Clients import their SDK when first constructed, and the tool orchestrator
+    imports the tools package the same way, so test modules that only use mock
+    clients never pay for either. Runs in a fresh interpreter because other
+    tests may already have imported them.
+    """
+    code = (
+        "import sys, codecrew.orchestrator; "
+        "print(','.join(m for m in "
+        "('anthropic', 'openai', 'google.genai', 'tiktoken', 'codecrew.tools') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
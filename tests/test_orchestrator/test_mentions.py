@@ -145,6 +145,13 @@ class TestContainsMention:
         assert contains_mention("@CLAUDE help", "claude") is True
         assert contains_mention("@Claude help", "claude") is True
 
+    def test_word_boundary(self) -> None:
+        """Test that the name must end at a word boundary."""
+        assert contains_mention("ask @gpt, then @claude.", "gpt") is True
+        assert contains_mention("ask @claude.", "claude") is True
+        assert contains_mention("ask @claude_bot", "claude") is False
+        assert contains_mention("@gpt4 then @gpt", "gpt") is True
+
 
 class TestContainsAnyMention:
     """Tests for contains_any_mention function."""
@@ -157,3 +164,9 @@ class TestContainsAnyMention:
     def test_no_mention(self) -> None:
         """Test message without mention."""
         assert contains_any_mention("no mention here") is False
+
+    def test_at_sign_without_mention(self) -> None:
+        """Test messages whose @ cannot start a mention."""
+        assert contains_any_mention("mail me at bob@example.com") is False
+        assert contains_any_mention("trailing @") is False
+        assert contains_any_mention("@galaxy brain") is False
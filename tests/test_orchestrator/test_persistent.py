@@ -1,8 +1,9 @@
 """Tests for PersistentOrchestrator."""
 
 import asyncio
+from collections import deque
 from pathlib import Path
-from typing import AsyncIterator, Optional
+from typing import AsyncGenerator, AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -18,102 +19,84 @@ from codecrew.models.types import (
     StreamChunk,
     Usage,
 )
-from codecrew.orchestrator import EventType
+from codecrew.orchestrator import EventType, OrchestratorEvent
+from codecrew.orchestrator.context import ContextAssembler
 from codecrew.orchestrator.persistent import (
     PersistentOrchestrator,
     create_persistent_orchestrator,
 )
 
+_USAGE = Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30)
+# Every mocked stream ends with the same chunk, so it is built once
+_STREAM_END = StreamChunk(is_complete=True, finish_reason=FinishReason.STOP, usage=_USAGE)
 
-class MockModelClient(ModelClient):
-    """Mock model client for testing."""
 
-    def __init__(self, name: str = "mock", available: bool = True):
-        self._name = name
-        self._available = available
-        self._responses = []
-        self._call_count = 0
-        self._model_id = f"{name}-model"
+def _make_mock_client(name: str = "mock", available: bool = True) -> MagicMock:
+    """Create a mock model client.
 
-    def _default_model_id(self) -> str:
-        return f"{self._name}-model"
+    Responses queued with ``add_response`` are returned in order, falling
+    back to "Mock response" once the queue is empty.
+    """
+    client = MagicMock(spec=ModelClient)
+    client.name = name
+    client.display_name = name.title()
+    client.color = "blue"
+    client.model_id = f"{name}-model"
+    client.is_available = available
+    client._responses = deque()
+    client.add_response = client._responses.append
 
-    @property
-    def name(self) -> str:
-        return self._name
+    def next_content() -> str:
+        return client._responses.popleft() if client._responses else "Mock response"
 
-    @property
-    def display_name(self) -> str:
-        return self._name.title()
-
-    @property
-    def color(self) -> str:
-        return "blue"
-
-    @property
-    def model_id(self) -> str:
-        return self._model_id
-
-    @property
-    def is_available(self) -> bool:
-        return self._available
-
-    def add_response(self, content: str) -> None:
-        """Add a response to return."""
-        self._responses.append(content)
-
-    async def generate(
-        self,
-        messages: list[Message],
-        system: Optional[str] = None,
-        max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None,
-    ) -> ModelResponse:
-        self._call_count += 1
-        content = self._responses.pop(0) if self._responses else "Mock response"
+    async def generate(messages: list[Message], **kwargs) -> ModelResponse:
         return ModelResponse(
-            content=content,
-            model=self._name,
+            content=next_content(),
+            model=name,
             finish_reason=FinishReason.STOP,
-            usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
+            usage=_USAGE,
         )
 
-    async def generate_stream(
-        self,
-        messages: list[Message],
-        system: Optional[str] = None,
-        max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None,
-    ) -> AsyncIterator[StreamChunk]:
-        self._call_count += 1
-        content = self._responses.pop(0) if self._responses else "Mock response"
-        yield StreamChunk(content=content)
-        yield StreamChunk(
-            is_complete=True,
-            finish_reason=FinishReason.STOP,
-            usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
-        )
+    async def generate_stream(messages: list[Message], **kwargs) -> AsyncIterator[StreamChunk]:
+        yield StreamChunk(content=next_content())
+        yield _STREAM_END
+
+    client.generate = AsyncMock(side_effect=generate)
+    # An async generator function, so the stream is iterated rather than awaited
+    client.generate_stream = MagicMock(side_effect=generate_stream)
+    client.count_tokens = MagicMock(side_effect=lambda text: len(text) // 4)
+    client.count_tokens_batch = MagicMock(
+        side_effect=lambda texts: [len(text) // 4 for text in texts]
+    )
+    return client
+
+
+async def _drain(events: AsyncIterator[OrchestratorEvent]) -> None:
+    """Run an event stream to completion, discarding the events."""
+    async for _ in events:
+        pass
 
-    def count_tokens(self, text: str) -> int:
-        return len(text) // 4
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_manager() -> AsyncGenerator[DatabaseManager, None]:
+    """Create one migrated in-memory database for the session.
 
-@pytest_asyncio.fixture
-async def db_manager(temp_dir: Path) -> DatabaseManager:
-    """Create an initialized database manager."""
-    db_path = temp_dir / "test_persistent.db"
-    db = DatabaseManager(db_path)
-    await db.initialize()
-    return db
+    The persistent connection is opened before migrating, since an in-memory
+    database lives only as long as its connection.
+    """
+    db = DatabaseManager(":memory:")
+    async with db:
+        await db.initialize()
+        yield db
 
 
-@pytest_asyncio.fixture
-async def conversation_manager(db_manager: DatabaseManager) -> ConversationManager:
-    """Create a ConversationManager."""
+@pytest.fixture(scope="module")
+def conversation_manager(db_manager: DatabaseManager) -> ConversationManager:
+    """Create one ConversationManager for the module."""
     return ConversationManager(db=db_manager)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_settings() -> Settings:
     """Create test settings."""
     return Settings(
@@ -122,22 +105,22 @@ def test_settings() -> Settings:
     )
 
 
-@pytest.fixture
-def mock_clients() -> dict[str, MockModelClient]:
+@pytest.fixture(scope="module")
+def mock_clients() -> dict[str, MagicMock]:
     """Create mock model clients."""
     return {
-        "claude": MockModelClient("claude"),
-        "gpt": MockModelClient("gpt"),
+        "claude": _make_mock_client("claude"),
+        "gpt": _make_mock_client("gpt"),
     }
 
 
-@pytest_asyncio.fixture
-async def persistent_orchestrator(
-    mock_clients: dict[str, MockModelClient],
+@pytest.fixture(scope="module")
+def persistent_orchestrator(
+    mock_clients: dict[str, MagicMock],
     test_settings: Settings,
     conversation_manager: ConversationManager,
 ) -> PersistentOrchestrator:
-    """Create a PersistentOrchestrator for testing."""
+    """Create one PersistentOrchestrator for the module."""
     return PersistentOrchestrator(
         clients=mock_clients,
         settings=test_settings,
@@ -145,12 +128,40 @@ async def persistent_orchestrator(
     )
 
 
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def reset_persistent_state(
+    persistent_orchestrator: PersistentOrchestrator,
+    mock_clients: dict[str, MagicMock],
+    db_manager: DatabaseManager,
+    request: pytest.FixtureRequest,
+) -> AsyncGenerator[None, None]:
+    """Reset the shared orchestrator and clients, wiping the database afterwards.
+
+    Responses declared with ``@pytest.mark.mock_responses({model: [...]})``
+    are queued on the clients before the test runs.
+    """
+    await persistent_orchestrator.clear_conversation()
+    conversation_manager = persistent_orchestrator.conversation_manager
+    conversation_manager._current_session_id = None
+    conversation_manager._pinned_ids.clear()
+    conversation_manager._message_id_map.clear()
+    for client in mock_clients.values():
+        client._responses.clear()
+    marker = request.node.get_closest_marker("mock_responses")
+    if marker:
+        for name, responses in marker.args[0].items():
+            mock_clients[name]._responses.extend(responses)
+    yield
+    # Deleting sessions cascades to messages, tool calls, pins and summaries
+    await db_manager.execute("DELETE FROM sessions")
+
+
 class TestPersistentOrchestratorInit:
     """Tests for PersistentOrchestrator initialization."""
 
     def test_init(
         self,
-        mock_clients: dict[str, MockModelClient],
+        mock_clients: dict[str, MagicMock],
         test_settings: Settings,
         conversation_manager: ConversationManager,
     ) -> None:
@@ -167,7 +178,7 @@ class TestPersistentOrchestratorInit:
 
     def test_init_with_summary_manager(
         self,
-        mock_clients: dict[str, MockModelClient],
+        mock_clients: dict[str, MagicMock],
         test_settings: Settings,
         conversation_manager: ConversationManager,
     ) -> None:
@@ -257,40 +268,26 @@ class TestMessageProcessing:
     """Tests for message processing with persistence."""
 
     @pytest.mark.asyncio
+    @pytest.mark.mock_responses({"claude": ["Hello! How can I help?"], "gpt": ["I can also help!"]})
     async def test_process_message_creates_session(
-        self,
-        persistent_orchestrator: PersistentOrchestrator,
-        mock_clients: dict[str, MockModelClient],
+        self, persistent_orchestrator: PersistentOrchestrator
     ) -> None:
         """Test that process_message creates a session if needed."""
-        # Add expected response
-        mock_clients["claude"].add_response("Hello! How can I help?")
-        mock_clients["gpt"].add_response("I can also help!")
-
         assert persistent_orchestrator.has_session is False
 
-        events = []
-        async for event in persistent_orchestrator.process_message("@claude Hello"):
-            events.append(event)
+        await _drain(persistent_orchestrator.process_message("@claude Hello"))
 
         assert persistent_orchestrator.has_session is True
 
     @pytest.mark.asyncio
+    @pytest.mark.mock_responses({"claude": ["Test response"]})
     async def test_process_message_persists(
-        self,
-        persistent_orchestrator: PersistentOrchestrator,
-        mock_clients: dict[str, MockModelClient],
+        self, persistent_orchestrator: PersistentOrchestrator
     ) -> None:
         """Test that messages are persisted after processing."""
         await persistent_orchestrator.create_session(name="Persist Test")
 
-        mock_clients["claude"].add_response("Test response")
-
-        events = []
-        async for event in persistent_orchestrator.process_message(
-            "@claude Hello", auto_persist=True
-        ):
-            events.append(event)
+        await _drain(persistent_orchestrator.process_message("@claude Hello", auto_persist=True))
 
         # Check that messages were persisted
         messages = await persistent_orchestrator.conversation_manager.get_conversation_messages()
@@ -298,21 +295,14 @@ class TestMessageProcessing:
         assert len(messages) >= 1
 
     @pytest.mark.asyncio
+    @pytest.mark.mock_responses({"claude": ["Test response"]})
     async def test_process_message_no_auto_persist(
-        self,
-        persistent_orchestrator: PersistentOrchestrator,
-        mock_clients: dict[str, MockModelClient],
+        self, persistent_orchestrator: PersistentOrchestrator
     ) -> None:
         """Test that auto_persist=False skips persistence."""
         await persistent_orchestrator.create_session(name="No Persist Test")
 
-        mock_clients["claude"].add_response("Test response")
-
-        events = []
-        async for event in persistent_orchestrator.process_message(
-            "@claude Hello", auto_persist=False
-        ):
-            events.append(event)
+        await _drain(persistent_orchestrator.process_message("@claude Hello", auto_persist=False))
 
         # In-memory conversation should have messages
         assert len(persistent_orchestrator.conversation) > 0
@@ -358,6 +348,34 @@ class TestPinManagement:
         assert result is True
         assert msg_id not in persistent_orchestrator.pinned_ids
 
+    @pytest.mark.asyncio
+    async def test_loaded_pin_survives_trimming(
+        self,
+        persistent_orchestrator: PersistentOrchestrator,
+        mock_clients: dict[str, ModelClient],
+    ) -> None:
+        """Test that a pin stored by database ID keeps its message in a trimmed context."""
+        session_id = await persistent_orchestrator.create_session(name="Trim Test")
+        manager = persistent_orchestrator.conversation_manager
+        pinned_id = await manager.persist_message(Message.user("Pinned " + "A" * 500))
+        for filler in "BCD":
+            await manager.persist_message(Message.user(filler * 500))
+        await persistent_orchestrator.pin_message(pinned_id)
+
+        await persistent_orchestrator.load_session(session_id)
+
+        # Room for the pin and one ~125-token message, not all four
+        assembler = ContextAssembler(max_tokens=300, response_reserve=20)
+        _, messages = assembler.assemble_for_model(
+            conversation=persistent_orchestrator.conversation,
+            model=mock_clients["claude"],
+            other_models=[],
+            pinned_ids=persistent_orchestrator.orchestrator.pinned_ids,
+            include_system=False,
+        )
+
+        assert [m.content[0] for m in messages] == ["P", "D"]
+
 
 class TestUtilityMethods:
     """Tests for utility methods."""
@@ -433,6 +451,15 @@ class TestAvailableModels:
         assert "claude" in models
         assert "gpt" in models
 
+    def test_available_models_not_rebuilt(
+        self, persistent_orchestrator: PersistentOrchestrator
+    ) -> None:
+        """Test that the list computed at construction is returned as-is."""
+        models = persistent_orchestrator.available_models
+
+        assert persistent_orchestrator.available_models is models
+        assert models is persistent_orchestrator.orchestrator.available_models
+
 
 class TestFactoryFunction:
     """Tests for the factory function."""
@@ -440,7 +467,7 @@ class TestFactoryFunction:
     @pytest.mark.asyncio
     async def test_create_persistent_orchestrator(
         self,
-        mock_clients: dict[str, MockModelClient],
+        mock_clients: dict[str, MagicMock],
         test_settings: Settings,
         temp_dir: Path,
     ) -> None:
@@ -461,7 +488,7 @@ class TestFactoryFunction:
     @pytest.mark.asyncio
     async def test_create_persistent_orchestrator_no_summarization(
         self,
-        mock_clients: dict[str, MockModelClient],
+        mock_clients: dict[str, MagicMock],
         test_settings: Settings,
         temp_dir: Path,
     ) -> None:
@@ -18,15 +18,20 @@ class MockModelClient:
         name: str = "test",
         response_content: str = '{"should_speak": true, "confidence": 0.8, "reason": "test"}',
         is_available: bool = True,
-        delay: float = 0.0,
+        hang: bool = False,
     ):
         self.name = name
         self.display_name = name.title()
         self.color = "#000000"
         self.model_id = f"{name}-test"
-        self._response_content = response_content
+        # Built once and returned from every call; the evaluator only reads it
+        self._response = ModelResponse(
+            content=response_content,
+            model=name,
+            finish_reason=FinishReason.STOP,
+        )
         self._is_available = is_available
-        self._delay = delay
+        self._hang = hang
 
     @property
     def is_available(self) -> bool:
@@ -40,13 +45,10 @@ class MockModelClient:
         system=None,
         tools=None,
     ) -> ModelResponse:
-        if self._delay:
-            await asyncio.sleep(self._delay)
-        return ModelResponse(
-            content=self._response_content,
-            model=self.name,
-            finish_reason=FinishReason.STOP,
-        )
+        if self._hang:
+            # Never set, so only the evaluator's timeout ends the call
+            await asyncio.Event().wait()
+        return self._response
 
     def count_tokens(self, text: str) -> int:
         return len(text) // 4
@@ -157,14 +159,27 @@ class TestSpeakingEvaluator:
         confidences = [d.confidence for d in decisions]
         assert confidences == sorted(confidences, reverse=True)
 
+    @pytest.mark.asyncio
+    async def test_ties_sorted_by_model_name(self) -> None:
+        """Test that equal confidences come back in model name order."""
+        clients = {name: MockModelClient(name) for name in ("grok", "claude", "gpt")}
+
+        evaluator = SpeakingEvaluator(clients)
+        decisions = await evaluator.evaluate_all(
+            conversation=[],
+            user_message="test",
+        )
+
+        assert [d.model for d in decisions] == ["claude", "gpt", "grok"]
+
     @pytest.mark.asyncio
     async def test_timeout_handling(self) -> None:
         """Test that timeouts are handled gracefully."""
         clients = {
-            "claude": MockModelClient("claude", delay=10.0),  # Will timeout
+            "claude": MockModelClient("claude", hang=True),  # Will timeout
         }
 
-        evaluator = SpeakingEvaluator(clients, timeout=0.1)
+        evaluator = SpeakingEvaluator(clients, timeout=0.01)
         decisions = await evaluator.evaluate_all(
             conversation=[],
             user_message="test",
@@ -175,6 +190,35 @@ class TestSpeakingEvaluator:
         assert decisions[0].should_speak is True
         assert "timed out" in decisions[0].reason.lower()
 
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self) -> None:
+        """Test that no more than max_concurrent model calls run at once."""
+        response = MockModelClient()._response
+        in_flight = 0
+        peak = 0
+
+        async def generate(**kwargs) -> ModelResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return response
+
+        clients = {}
+        for name in ("claude", "gpt", "gemini", "grok", "local"):
+            clients[name] = MockModelClient(name)
+            clients[name].generate = generate
+
+        evaluator = SpeakingEvaluator(clients, max_concurrent=2)
+        decisions = await evaluator.evaluate_all(
+            conversation=[],
+            user_message="test",
+        )
+
+        assert len(decisions) == 5
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_error_handling(self) -> None:
         """Test that errors are handled gracefully."""
@@ -194,6 +238,86 @@ class TestSpeakingEvaluator:
         assert decisions[0].should_speak is True
 
 
+class TestBatchedEvaluation:
+    """Tests for router-based batched evaluation."""
+
+    @pytest.mark.asyncio
+    async def test_router_decides_for_all(self) -> None:
+        """Test that one router answer yields a decision per model."""
+        clients = {
+            "claude": MockModelClient(
+                "claude",
+                response_content=(
+                    '{"claude": {"should_speak": true, "confidence": 0.9, "reason": "unique"},'
+                    ' "gpt": {"should_speak": false, "confidence": 0.1, "reason": "covered"}}'
+                ),
+            ),
+            "gpt": MockModelClient("gpt", response_content="not consulted"),
+        }
+
+        evaluator = SpeakingEvaluator(clients, router="claude")
+        decisions = await evaluator.evaluate_all([], "test")
+
+        by_model = {d.model: d for d in decisions}
+        assert by_model["claude"].should_speak is True
+        assert by_model["claude"].confidence == 0.9
+        assert by_model["gpt"].should_speak is False
+        assert by_model["gpt"].reason.startswith("Below threshold")
+
+    @pytest.mark.asyncio
+    async def test_forced_speakers_skip_router(self) -> None:
+        """Test that forced speakers are not left to the router."""
+        clients = {
+            "claude": MockModelClient(
+                "claude",
+                response_content='{"gpt": {"should_speak": true, "confidence": 0.6, "reason": "x"}}',
+            ),
+            "gpt": MockModelClient("gpt"),
+        }
+
+        evaluator = SpeakingEvaluator(clients, router="claude")
+        decisions = await evaluator.evaluate_all([], "test", forced_speakers=["claude"])
+
+        assert [(d.model, d.is_forced) for d in decisions] == [("claude", True), ("gpt", False)]
+
+    @pytest.mark.asyncio
+    async def test_router_failure_falls_back(self) -> None:
+        """Test that an unusable router answer falls back to per-model probes."""
+        clients = {
+            "claude": MockModelClient("claude", response_content="no idea"),
+            "gpt": MockModelClient("gpt"),
+        }
+
+        evaluator = SpeakingEvaluator(clients, router="claude")
+        decisions = await evaluator.evaluate_all([], "test")
+
+        by_model = {d.model: d for d in decisions}
+        assert by_model["gpt"].confidence == 0.8
+        assert by_model["claude"].reason == "Could not parse response - defaulting to speak"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("confidence", ["null", '"high"'])
+    async def test_router_invalid_confidence_falls_back(self, confidence: str) -> None:
+        """Test that a router entry with a non-numeric confidence falls back."""
+        clients = {
+            "claude": MockModelClient(
+                "claude",
+                response_content=(
+                    '{"claude": {"should_speak": true, "confidence": 0.9, "reason": "x"},'
+                    f' "gpt": {{"should_speak": true, "confidence": {confidence}, "reason": "y"}}}}'
+                ),
+            ),
+            "gpt": MockModelClient("gpt"),
+        }
+
+        evaluator = SpeakingEvaluator(clients, router="claude")
+        decisions = await evaluator.evaluate_all([], "test")
+
+        by_model = {d.model: d for d in decisions}
+        assert set(by_model) == {"claude", "gpt"}
+        assert by_model["gpt"].confidence == 0.8
+
+
 class TestResponseParsing:
     """Tests for parsing model responses."""
 
@@ -230,6 +354,22 @@ class TestResponseParsing:
         assert decisions[0].should_speak is False
         assert decisions[0].confidence == 0.3
 
+    @pytest.mark.asyncio
+    async def test_parse_json_after_prose(self) -> None:
+        """Test parsing JSON preceded by prose."""
+        clients = {
+            "claude": MockModelClient(
+                "claude",
+                response_content='Sure. {"should_speak": true, "confidence": 0.6, "reason": "x"}',
+            ),
+        }
+
+        evaluator = SpeakingEvaluator(clients)
+        decisions = await evaluator.evaluate_all([], "test")
+
+        assert decisions[0].should_speak is True
+        assert decisions[0].confidence == 0.6
+
     @pytest.mark.asyncio
     async def test_parse_invalid_json(self) -> None:
         """Test parsing invalid JSON defaults to speaking."""
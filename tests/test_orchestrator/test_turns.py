@@ -35,6 +35,7 @@ class TestTurnManager:
         assert tm.current_first_responder == "gemini"
         tm.rotate_first_responder()
         assert tm.current_first_responder == "claude"  # Wraps around
+        assert tm.fixed_order == ["claude", "gpt", "gemini"]  # Rotation never reorders
 
     def test_reset_rotation(self) -> None:
         """Test resetting rotation."""
@@ -112,6 +113,21 @@ class TestDetermineOrder:
         order3 = tm.determine_order(decisions)
         assert order3[0] == "gemini"
 
+    def test_rotate_strategy_wraps_fixed_order(self) -> None:
+        """Rotated order wraps around fixed_order and skips silent models."""
+        tm = TurnManager(strategy="rotate", fixed_order=["claude", "gpt", "gemini", "grok"])
+        tm.set_first_responder("gemini")
+
+        decisions = [
+            SpeakerDecision.speak("claude", 0.7, "reason"),
+            SpeakerDecision.silent("gpt", 0.2, "nothing to add"),
+            SpeakerDecision.speak("gemini", 0.6, "reason"),
+            SpeakerDecision.speak("grok", 0.5, "reason"),
+        ]
+
+        assert tm.determine_order(decisions) == ["gemini", "grok", "claude"]
+        assert tm.determine_order(decisions) == ["grok", "claude", "gemini"]
+
     def test_silent_models_excluded(self) -> None:
         """Test that silent models are excluded from order."""
         tm = TurnManager(strategy="fixed", fixed_order=["claude", "gpt", "gemini"])
@@ -144,6 +160,15 @@ class TestDetermineOrder:
         order = tm.determine_order(decisions)
         assert order == []
 
+    def test_decisions_are_immutable(self) -> None:
+        """Decisions are frozen and slotted, so ordering never mutates them."""
+        decision = SpeakerDecision.speak("claude", 0.9, "expert")
+
+        with pytest.raises(AttributeError):
+            decision.confidence = 0.1  # type: ignore[misc]
+
+        assert not hasattr(decision, "__dict__")
+
 
 class TestCreateTurnManager:
     """Tests for create_turn_manager factory."""
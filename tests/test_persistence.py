@@ -1,7 +1,9 @@
 """Tests for database persistence."""
 
-import uuid
+import asyncio
+import shutil
 from pathlib import Path
+from typing import Callable
 
 import pytest
 import pytest_asyncio
@@ -10,6 +12,14 @@ from codecrew.conversation import DatabaseManager
 from codecrew.conversation.migrations import get_current_version
 
 
+@pytest_asyncio.fixture
+async def file_db_manager(temp_dir: Path, migrated_db_template: Path) -> DatabaseManager:
+    """Create a file-backed database manager, for tests that open and close it."""
+    db_path = temp_dir / "test.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    return DatabaseManager(db_path)
+
+
 class TestDatabaseManager:
     """Tests for DatabaseManager."""
 
@@ -52,14 +62,94 @@ class TestDatabaseManager:
         version = await db.get_version()
         assert version >= 1
 
+    @pytest.mark.asyncio
+    async def test_persistent_connection(self, file_db_manager: DatabaseManager) -> None:
+        """Test that an open manager reuses one connection until closed."""
+        async with file_db_manager:
+            assert file_db_manager.is_open
+            async with file_db_manager.connect() as first:
+                pass
+            async with file_db_manager.connect() as second:
+                pass
+            assert first is second
+
+            await file_db_manager.create_session(session_id="persistent", name="Shared")
+
+        assert not file_db_manager.is_open
+        session = await file_db_manager.get_session("persistent")
+        assert session["name"] == "Shared"
+
+    @pytest.mark.asyncio
+    async def test_in_memory_database(self) -> None:
+        """Test that an open in-memory database keeps its schema and data."""
+        async with DatabaseManager(":memory:") as db:
+            await db.initialize()
+            await db.create_session(session_id="memory", name="In memory")
+
+            session = await db.get_session("memory")
+            assert session["name"] == "In memory"
+
+    @pytest.mark.asyncio
+    async def test_persistent_connection_rolls_back_on_error(
+        self, file_db_manager: DatabaseManager
+    ) -> None:
+        """Test that a failed block doesn't leak uncommitted writes."""
+        async with file_db_manager:
+            with pytest.raises(RuntimeError):
+                async with file_db_manager.connect() as conn:
+                    await conn.execute(
+                        "INSERT INTO sessions (id, name) VALUES (?, ?)", ("partial", "x")
+                    )
+                    raise RuntimeError("boom")
+
+            assert await file_db_manager.get_session("partial") is None
+
+    @pytest.mark.asyncio
+    async def test_close_with_active_and_queued_connections(
+        self, file_db_manager: DatabaseManager
+    ) -> None:
+        """Test that close() waits for queued blocks and later ones fall back."""
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def add_session(session_id: str, hold: bool = False) -> None:
+            async with file_db_manager.connect() as conn:
+                if hold:
+                    entered.set()
+                    await release.wait()
+                await conn.execute(
+                    "INSERT INTO sessions (id, name) VALUES (?, ?)", (session_id, "x")
+                )
+                await conn.commit()
+
+        await file_db_manager.open()
+        active = asyncio.create_task(add_session("active", hold=True))
+        await entered.wait()
+        # Queue one block before close() and one after it, all on the lock
+        queued = asyncio.create_task(add_session("queued"))
+        await asyncio.sleep(0)
+        closing = asyncio.create_task(file_db_manager.close())
+        await asyncio.sleep(0)
+        late = asyncio.create_task(add_session("late"))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(active, queued, closing, late)
+
+        assert not file_db_manager.is_open
+        for session_id in ("active", "queued", "late"):
+            assert await file_db_manager.get_session(session_id) is not None
+
 
 class TestSessionOperations:
     """Tests for session CRUD operations."""
 
     @pytest.mark.asyncio
-    async def test_create_session(self, db_manager: DatabaseManager) -> None:
+    async def test_create_session(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test creating a session."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         session = await db_manager.create_session(
             session_id=session_id,
             name="Test Session",
@@ -72,9 +162,11 @@ class TestSessionOperations:
         assert session["project_path"] == "/test/path"
 
     @pytest.mark.asyncio
-    async def test_get_session(self, db_manager: DatabaseManager) -> None:
+    async def test_get_session(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test retrieving a session."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id, name="Get Test")
 
         session = await db_manager.get_session(session_id)
@@ -88,35 +180,35 @@ class TestSessionOperations:
         assert session is None
 
     @pytest.mark.asyncio
-    async def test_list_sessions(self, db_manager: DatabaseManager) -> None:
+    async def test_list_sessions(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test listing sessions."""
-        # Create multiple sessions
-        for i in range(3):
-            await db_manager.create_session(
-                session_id=str(uuid.uuid4()),
-                name=f"Session {i}",
-            )
+        await db_manager.batch_create_sessions(
+            [{"id": fake_uuid(), "name": f"Session {i}"} for i in range(3)]
+        )
 
         sessions = await db_manager.list_sessions()
         assert len(sessions) >= 3
 
     @pytest.mark.asyncio
-    async def test_list_sessions_limit(self, db_manager: DatabaseManager) -> None:
+    async def test_list_sessions_limit(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test listing sessions with limit."""
-        # Create multiple sessions
-        for i in range(5):
-            await db_manager.create_session(
-                session_id=str(uuid.uuid4()),
-                name=f"Limited Session {i}",
-            )
+        await db_manager.batch_create_sessions(
+            [{"id": fake_uuid(), "name": f"Limited Session {i}"} for i in range(5)]
+        )
 
         sessions = await db_manager.list_sessions(limit=2)
         assert len(sessions) == 2
 
     @pytest.mark.asyncio
-    async def test_update_session(self, db_manager: DatabaseManager) -> None:
+    async def test_update_session(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test updating a session."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id, name="Original")
 
         updated = await db_manager.update_session(
@@ -126,11 +218,19 @@ class TestSessionOperations:
         )
 
         assert updated["name"] == "Updated Name"
+        assert updated == await db_manager.get_session(session_id)
+
+    @pytest.mark.asyncio
+    async def test_update_nonexistent_session(self, db_manager: DatabaseManager) -> None:
+        """Test that updating a missing session returns None."""
+        assert await db_manager.update_session(session_id="nonexistent", name="x") is None
 
     @pytest.mark.asyncio
-    async def test_delete_session(self, db_manager: DatabaseManager) -> None:
+    async def test_delete_session(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test deleting a session."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id, name="To Delete")
 
         result = await db_manager.delete_session(session_id)
@@ -146,9 +246,11 @@ class TestSessionOperations:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_search_sessions(self, db_manager: DatabaseManager) -> None:
+    async def test_search_sessions(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test searching sessions."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(
             session_id=session_id,
             name="Authentication Bug Fix",
@@ -158,17 +260,66 @@ class TestSessionOperations:
         assert len(results) >= 1
         assert any(s["id"] == session_id for s in results)
 
+    @pytest.mark.asyncio
+    async def test_search_sessions_prefix_and_content(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
+        """Test that search matches word prefixes in names and message content."""
+        named_id = fake_uuid()
+        await db_manager.create_session(session_id=named_id, name="Refactor parser")
+        content_id = fake_uuid()
+        await db_manager.create_session(session_id=content_id, name="Untitled")
+        await db_manager.add_message(
+            message_id=fake_uuid(),
+            session_id=content_id,
+            role="user",
+            content="The tokenizer drops trailing whitespace",
+        )
+
+        assert [s["id"] for s in await db_manager.search_sessions("refac")] == [named_id]
+        assert [s["id"] for s in await db_manager.search_sessions("tokeniz")] == [content_id]
+        assert await db_manager.search_sessions("nomatch") == []
+
+    @pytest.mark.asyncio
+    async def test_search_sessions_tracks_renames_and_deletes(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
+        """Test that the search index follows session updates and deletes."""
+        session_id = fake_uuid()
+        await db_manager.create_session(session_id=session_id, name="Old Title")
+
+        await db_manager.update_session(session_id=session_id, name="Fresh Title")
+        assert await db_manager.search_sessions("Old") == []
+        assert len(await db_manager.search_sessions("Fresh")) == 1
+
+        await db_manager.delete_session(session_id)
+        assert await db_manager.search_sessions("Fresh") == []
+
+    @pytest.mark.asyncio
+    async def test_search_sessions_special_characters(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
+        """Test that FTS syntax characters in the query are treated literally."""
+        session_id = fake_uuid()
+        await db_manager.create_session(session_id=session_id, name="Bug Fix #123")
+
+        results = await db_manager.search_sessions('#123 "fix')
+        assert [s["id"] for s in results] == [session_id]
+        assert await db_manager.search_sessions("AND OR NOT") == []
+
 
 class TestMessageOperations:
     """Tests for message CRUD operations."""
 
     @pytest.mark.asyncio
-    async def test_add_message(self, db_manager: DatabaseManager) -> None:
+    async def test_add_message(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test adding a message."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
-        message_id = str(uuid.uuid4())
+        message_id = fake_uuid()
         message = await db_manager.add_message(
             message_id=message_id,
             session_id=session_id,
@@ -181,12 +332,14 @@ class TestMessageOperations:
         assert message["role"] == "user"
 
     @pytest.mark.asyncio
-    async def test_add_assistant_message(self, db_manager: DatabaseManager) -> None:
+    async def test_add_assistant_message(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test adding an assistant message with model info."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
-        message_id = str(uuid.uuid4())
+        message_id = fake_uuid()
         message = await db_manager.add_message(
             message_id=message_id,
             session_id=session_id,
@@ -202,15 +355,17 @@ class TestMessageOperations:
         assert message["cost_estimate"] == 0.001
 
     @pytest.mark.asyncio
-    async def test_get_session_messages(self, db_manager: DatabaseManager) -> None:
+    async def test_get_session_messages(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test retrieving messages for a session."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
         # Add multiple messages
         for i in range(3):
             await db_manager.add_message(
-                message_id=str(uuid.uuid4()),
+                message_id=fake_uuid(),
                 session_id=session_id,
                 role="user" if i % 2 == 0 else "assistant",
                 content=f"Message {i}",
@@ -221,16 +376,16 @@ class TestMessageOperations:
 
     @pytest.mark.asyncio
     async def test_messages_ordered_chronologically(
-        self, db_manager: DatabaseManager
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
     ) -> None:
         """Test that messages are returned in chronological order."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
         # Add messages
         ids = []
         for i in range(3):
-            msg_id = str(uuid.uuid4())
+            msg_id = fake_uuid()
             ids.append(msg_id)
             await db_manager.add_message(
                 message_id=msg_id,
@@ -244,12 +399,14 @@ class TestMessageOperations:
         assert messages[0]["id"] == ids[0]
 
     @pytest.mark.asyncio
-    async def test_pin_message(self, db_manager: DatabaseManager) -> None:
+    async def test_pin_message(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test pinning a message."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
-        message_id = str(uuid.uuid4())
+        message_id = fake_uuid()
         await db_manager.add_message(
             message_id=message_id,
             session_id=session_id,
@@ -257,7 +414,7 @@ class TestMessageOperations:
             content="Important context",
         )
 
-        pin_id = str(uuid.uuid4())
+        pin_id = fake_uuid()
         await db_manager.pin_message(session_id, message_id, pin_id)
 
         message = await db_manager.get_message(message_id)
@@ -268,12 +425,14 @@ class TestMessageOperations:
         assert pinned[0]["id"] == message_id
 
     @pytest.mark.asyncio
-    async def test_unpin_message(self, db_manager: DatabaseManager) -> None:
+    async def test_unpin_message(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test unpinning a message."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
-        message_id = str(uuid.uuid4())
+        message_id = fake_uuid()
         await db_manager.add_message(
             message_id=message_id,
             session_id=session_id,
@@ -281,7 +440,7 @@ class TestMessageOperations:
             content="Temporary pin",
         )
 
-        pin_id = str(uuid.uuid4())
+        pin_id = fake_uuid()
         await db_manager.pin_message(session_id, message_id, pin_id)
         await db_manager.unpin_message(message_id)
 
@@ -296,12 +455,14 @@ class TestToolCallOperations:
     """Tests for tool call operations."""
 
     @pytest.mark.asyncio
-    async def test_add_tool_call(self, db_manager: DatabaseManager) -> None:
+    async def test_add_tool_call(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test adding a tool call."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
-        message_id = str(uuid.uuid4())
+        message_id = fake_uuid()
         await db_manager.add_message(
             message_id=message_id,
             session_id=session_id,
@@ -309,7 +470,7 @@ class TestToolCallOperations:
             content="Let me read that file.",
         )
 
-        tool_call_id = str(uuid.uuid4())
+        tool_call_id = fake_uuid()
         tool_call = await db_manager.add_tool_call(
             tool_call_id=tool_call_id,
             message_id=message_id,
@@ -322,12 +483,14 @@ class TestToolCallOperations:
         assert tool_call["status"] == "pending"
 
     @pytest.mark.asyncio
-    async def test_update_tool_call(self, db_manager: DatabaseManager) -> None:
+    async def test_update_tool_call(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test updating a tool call with results."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
-        message_id = str(uuid.uuid4())
+        message_id = fake_uuid()
         await db_manager.add_message(
             message_id=message_id,
             session_id=session_id,
@@ -335,7 +498,7 @@ class TestToolCallOperations:
             content="Running command.",
         )
 
-        tool_call_id = str(uuid.uuid4())
+        tool_call_id = fake_uuid()
         await db_manager.add_tool_call(
             tool_call_id=tool_call_id,
             message_id=message_id,
@@ -353,12 +516,14 @@ class TestToolCallOperations:
         assert updated["executed_at"] is not None
 
     @pytest.mark.asyncio
-    async def test_get_message_tool_calls(self, db_manager: DatabaseManager) -> None:
+    async def test_get_message_tool_calls(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
         """Test getting tool calls for a message."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
-        message_id = str(uuid.uuid4())
+        message_id = fake_uuid()
         await db_manager.add_message(
             message_id=message_id,
             session_id=session_id,
@@ -369,7 +534,7 @@ class TestToolCallOperations:
         # Add multiple tool calls
         for i in range(3):
             await db_manager.add_tool_call(
-                tool_call_id=str(uuid.uuid4()),
+                tool_call_id=fake_uuid(),
                 message_id=message_id,
                 tool_name=f"tool_{i}",
             )
@@ -377,19 +542,84 @@ class TestToolCallOperations:
         tool_calls = await db_manager.get_message_tool_calls(message_id)
         assert len(tool_calls) == 3
 
+    @pytest.mark.asyncio
+    async def test_get_session_messages_with_tool_calls(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
+        """Test loading messages and their tool calls in one query."""
+        session_id = fake_uuid()
+        await db_manager.create_session(session_id=session_id)
+
+        plain_id = fake_uuid()
+        await db_manager.add_message(
+            message_id=plain_id, session_id=session_id, role="user", content="Read it"
+        )
+        tool_msg_id = fake_uuid()
+        await db_manager.add_message(
+            message_id=tool_msg_id,
+            session_id=session_id,
+            role="assistant",
+            content="Reading.",
+        )
+        for i in range(2):
+            await db_manager.add_tool_call(
+                tool_call_id=f"tc-{i}",
+                message_id=tool_msg_id,
+                tool_name="read_file",
+                parameters={"path": f"file{i}.txt"},
+            )
+
+        rows = await db_manager.get_session_messages_with_tool_calls(session_id)
+
+        assert [r["id"] for r in rows] == [plain_id, tool_msg_id]
+        assert rows[0]["tool_calls"] == []
+        assert rows[1]["tool_calls"] == await db_manager.get_message_tool_calls(tool_msg_id)
+
+        limited = await db_manager.get_session_messages_with_tool_calls(session_id, limit=1)
+        assert [r["id"] for r in limited] == [plain_id]
+
+    @pytest.mark.asyncio
+    async def test_session_tool_calls_ordered_by_execution(
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
+    ) -> None:
+        """Test that aggregated tool calls follow executed_at, not insertion order."""
+        session_id = fake_uuid()
+        await db_manager.create_session(session_id=session_id)
+        message_id = fake_uuid()
+        await db_manager.add_message(
+            message_id=message_id, session_id=session_id, role="assistant", content="Done."
+        )
+        for tool_call_id, executed_at in [
+            ("tc-late", "2024-01-02T00:00:00+00:00"),
+            ("tc-pending", None),
+            ("tc-early", "2024-01-01T00:00:00+00:00"),
+        ]:
+            await db_manager.execute(
+                """
+                INSERT INTO tool_calls (id, message_id, tool_name, status, executed_at)
+                VALUES (?, ?, 'read_file', 'success', ?)
+                """,
+                (tool_call_id, message_id, executed_at),
+            )
+
+        rows = await db_manager.get_session_messages_with_tool_calls(session_id)
+
+        assert [tc["id"] for tc in rows[0]["tool_calls"]] == ["tc-pending", "tc-early", "tc-late"]
+        assert rows[0]["tool_calls"] == await db_manager.get_message_tool_calls(message_id)
+
 
 class TestCascadeDelete:
     """Tests for cascade delete behavior."""
 
     @pytest.mark.asyncio
     async def test_delete_session_cascades_to_messages(
-        self, db_manager: DatabaseManager
+        self, db_manager: DatabaseManager, fake_uuid: Callable[[], str]
     ) -> None:
         """Test that deleting a session also deletes its messages."""
-        session_id = str(uuid.uuid4())
+        session_id = fake_uuid()
         await db_manager.create_session(session_id=session_id)
 
-        message_id = str(uuid.uuid4())
+        message_id = fake_uuid()
         await db_manager.add_message(
             message_id=message_id,
             session_id=session_id,
@@ -1,8 +1,8 @@
 """Tests for DatabaseManager batch operations and statistics."""
 
+import sqlite3
 import uuid
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 
 import pytest
 import pytest_asyncio
@@ -10,15 +10,6 @@ import pytest_asyncio
 from codecrew.conversation import DatabaseManager
 
 
-@pytest_asyncio.fixture
-async def db_manager(temp_dir: Path) -> DatabaseManager:
-    """Create an initialized database manager."""
-    db_path = temp_dir / "test_batch.db"
-    db = DatabaseManager(db_path)
-    await db.initialize()
-    return db
-
-
 @pytest_asyncio.fixture
 async def session_with_messages(db_manager: DatabaseManager) -> str:
     """Create a session with some messages and return session ID."""
@@ -40,6 +31,30 @@ async def session_with_messages(db_manager: DatabaseManager) -> str:
     return session_id
 
 
+class TestBatchSessionOperations:
+    """Tests for batch session operations."""
+
+    @pytest.mark.asyncio
+    async def test_batch_create_sessions(self, db_manager: DatabaseManager) -> None:
+        """Test creating multiple sessions in a batch."""
+        sessions = [
+            {"id": str(uuid.uuid4()), "name": "First", "project_path": "/a"},
+            {"id": str(uuid.uuid4()), "name": "Second", "metadata": {"key": "value"}},
+        ]
+
+        ids = await db_manager.batch_create_sessions(sessions)
+
+        assert ids == [s["id"] for s in sessions]
+        second = await db_manager.get_session(ids[1])
+        assert second["name"] == "Second"
+        assert second["metadata"] == '{"key": "value"}'
+
+    @pytest.mark.asyncio
+    async def test_batch_create_sessions_empty(self, db_manager: DatabaseManager) -> None:
+        """Test batch create with empty list returns empty list."""
+        assert await db_manager.batch_create_sessions([]) == []
+
+
 class TestBatchMessageOperations:
     """Tests for batch message operations."""
 
@@ -87,6 +102,55 @@ class TestBatchMessageOperations:
         ids = await db_manager.batch_add_messages([])
         assert ids == []
 
+    @pytest.mark.asyncio
+    async def test_batch_add_messages_with_tool_calls_is_atomic(
+        self, db_manager: DatabaseManager
+    ) -> None:
+        """Test that messages are not kept when their tool calls fail to insert."""
+        session_id = str(uuid.uuid4())
+        await db_manager.create_session(session_id=session_id, name="Atomic Test")
+        message_id = str(uuid.uuid4())
+        messages = [
+            {"id": message_id, "session_id": session_id, "role": "assistant", "content": "x"}
+        ]
+
+        # Unknown message ID violates the tool_calls foreign key
+        with pytest.raises(sqlite3.IntegrityError):
+            await db_manager.batch_add_messages(
+                messages,
+                tool_calls=[{"id": "tc-1", "message_id": "missing", "tool_name": "read_file"}],
+            )
+        assert await db_manager.get_session_messages(session_id) == []
+
+        await db_manager.batch_add_messages(
+            messages,
+            tool_calls=[{"id": "tc-1", "message_id": message_id, "tool_name": "read_file"}],
+        )
+        tool_calls = await db_manager.get_message_tool_calls(message_id)
+        assert [tc["id"] for tc in tool_calls] == ["tc-1"]
+
+    @pytest.mark.asyncio
+    async def test_batch_add_messages_pins(self, db_manager: DatabaseManager) -> None:
+        """Test that messages flagged is_pinned are pinned in the same batch."""
+        session_id = str(uuid.uuid4())
+        await db_manager.create_session(session_id=session_id, name="Batch Pin Test")
+        messages = [
+            {
+                "id": str(uuid.uuid4()),
+                "session_id": session_id,
+                "role": "user",
+                "content": f"Message {i}",
+                "is_pinned": i == 1,
+            }
+            for i in range(3)
+        ]
+
+        await db_manager.batch_add_messages(messages)
+
+        pinned = await db_manager.get_pinned_messages(session_id)
+        assert [row["id"] for row in pinned] == [messages[1]["id"]]
+        assert bool(pinned[0]["is_pinned"]) is True
+
     @pytest.mark.asyncio
     async def test_batch_add_updates_session_timestamp(
         self, db_manager: DatabaseManager
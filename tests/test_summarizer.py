@@ -1,7 +1,6 @@
 """Tests for SummaryManager and conversation summarization."""
 
 import uuid
-from pathlib import Path
 from typing import AsyncIterator, Optional
 from unittest.mock import AsyncMock, MagicMock
 
@@ -80,15 +79,6 @@ class MockModelClient(ModelClient):
         return len(text) // 4
 
 
-@pytest_asyncio.fixture
-async def db_manager(temp_dir: Path) -> DatabaseManager:
-    """Create an initialized database manager."""
-    db_path = temp_dir / "test_summarizer.db"
-    db = DatabaseManager(db_path)
-    await db.initialize()
-    return db
-
-
 @pytest_asyncio.fixture
 async def summary_manager(db_manager: DatabaseManager) -> SummaryManager:
     """Create a SummaryManager with mock client."""
@@ -252,6 +242,29 @@ class TestAutomaticSummarization:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_check_and_summarize_counts_each_message_once(
+        self, summary_manager: SummaryManager, session_id: str
+    ) -> None:
+        """Test that repeated checks only tokenize messages not seen before."""
+        messages = [
+            Message.user("Hi"),
+            Message.assistant("Hello!", model="claude"),
+        ]
+        token_counter = MockModelClient()
+        token_counter.count_tokens_batch = MagicMock(side_effect=lambda texts: [1] * len(texts))
+
+        await summary_manager.check_and_summarize(
+            session_id=session_id, messages=messages, token_counter=token_counter
+        )
+        messages.append(Message.user("Another"))
+        await summary_manager.check_and_summarize(
+            session_id=session_id, messages=messages, token_counter=token_counter
+        )
+
+        batches = [c.args[0] for c in token_counter.count_tokens_batch.call_args_list]
+        assert batches == [["Hi", "Hello!"], ["Another"]]
+
     @pytest.mark.asyncio
     async def test_check_and_summarize_above_threshold(
         self, db_manager: DatabaseManager, session_id: str